@@ -0,0 +1,55 @@
+import csv
+import os
+import numpy as np
+
+ESTACOES_CSV = ["Primavera", "Verão", "Outono", "Inverno"]
+COMBINACOES_ESTACOES = ESTACOES_CSV + ["Verão, Outono", "Primavera, Verão", "Primavera, Verão, Outono"]
+COLUNAS_CULTIVOS = ["cultivo", "estacao", "dias_cresc", "tipo_cultivo", "intervalo_colheita",
+                    "preco_semente", "preco_venda", "compravel", "obs"]
+COLUNAS_EVENTOS = ["estacao", "festival", "dia_festival", "afeta_cultivo", "obs"]
+
+
+def gerar_cultivos_csv(caminho, quantidade, semente=0):
+    # Mesmo layout do Cultivos.csv, com distribuições próximas às do catálogo real.
+    rng = np.random.default_rng(semente)
+    estacoes = rng.choice(COMBINACOES_ESTACOES, size=quantidade, p=[0.22, 0.22, 0.22, 0.04, 0.1, 0.1, 0.1])
+    dias_cresc = rng.integers(1, 29, size=quantidade)
+    rebrota = rng.random(quantidade) < 0.3
+    intervalo = rng.integers(1, 8, size=quantidade)
+    preco_semente = rng.choice([0, 20, 40, 50, 60, 80, 100, 150, 200, 400, 1000], size=quantidade)
+    preco_venda = (preco_semente * rng.uniform(1.1, 3.0, size=quantidade) + rng.integers(20, 120, size=quantidade)).round()
+
+    with open(caminho, "w", encoding="utf-8", newline="") as f:
+        escritor = csv.writer(f, delimiter=";")
+        escritor.writerow(COLUNAS_CULTIVOS)
+        for i in range(quantidade):
+            escritor.writerow([
+                f"Cultivo Sintético {i:06d}", estacoes[i], dias_cresc[i],
+                "Múltipla" if rebrota[i] else "Única", intervalo[i] if rebrota[i] else "",
+                preco_semente[i], int(preco_venda[i]), "Sim" if preco_semente[i] else "Não", "",
+            ])
+    return caminho
+
+
+def gerar_eventos_csv(caminho, quantidade, semente=0):
+    # Vários festivais por dia: só o primeiro de cada dia vale no calendário, os demais exercitam a indexação.
+    rng = np.random.default_rng(semente + 1)
+    estacoes = rng.choice(ESTACOES_CSV, size=quantidade)
+    dias = rng.integers(1, 29, size=quantidade)
+    afeta = rng.choice(["sim", "parcial", "nao"], size=quantidade, p=[0.1, 0.2, 0.7])
+
+    with open(caminho, "w", encoding="utf-8", newline="") as f:
+        escritor = csv.writer(f, delimiter=";")
+        escritor.writerow(COLUNAS_EVENTOS)
+        for i in range(quantidade):
+            escritor.writerow([estacoes[i], f"Festival Sintético {i:05d}", dias[i], afeta[i], "Evento gerado para benchmark."])
+    return caminho
+
+
+def gerar_catalogo(diretorio, quantidade_cultivos, semente=0):
+    os.makedirs(diretorio, exist_ok=True)
+    caminho_cultivos = os.path.join(diretorio, f"Cultivos_{quantidade_cultivos}.csv")
+    caminho_eventos = os.path.join(diretorio, f"Eventos_{quantidade_cultivos}.csv")
+    gerar_cultivos_csv(caminho_cultivos, quantidade_cultivos, semente)
+    gerar_eventos_csv(caminho_eventos, max(200, quantidade_cultivos // 10), semente)
+    return caminho_cultivos, caminho_eventos
@@ -0,0 +1,232 @@
+import os
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCH_DIR), "src")
+for caminho in (BENCH_DIR, SRC_DIR):
+    if caminho not in sys.path:
+        sys.path.insert(0, caminho)
+
+import argparse
+import contextlib
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import numpy as np
+
+from config import CAMINHO_CULTIVOS_CSV, CAMINHO_EVENTOS_CSV
+from logica import (
+    carregar_cultivos, carregar_eventos, get_preco_semente_map, listar_plantas_possiveis, calcular_colheitas,
+    calcular_colheitas_vetorizado
+)
+from tratamento_dados import gerar_plano, parse_intervalo_data
+from tratamento_menssagem import renderizar_texto_plano
+from catalogos_sinteticos import gerar_catalogo
+
+VERSAO_RESULTADOS = 1
+ESCALAS_SINTETICAS = [1000, 10000, 100000]
+INTERVALOS = ["Primavera D1 -> Primavera D28", "Verao D5 -> Outono D20", "Primavera D10 -> Inverno D28"]
+ENTRADA_PLANO = {"opcao_estrategia": "Área Plantável", "quantidade": 40, "data_inicio": "Primavera D1 -> Verao D28"}
+TOLERANCIA_REGRESSAO = 0.10
+# A exportação em PDF cresce com o número de cultivos do plano (~1 página a cada 12); acima disso ela é pulada.
+MAX_CULTIVOS_PDF = 10000
+
+
+def medir(funcao, repeticoes, aquecimento=1):
+    for _ in range(aquecimento):
+        funcao()
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return {
+        "repeticoes": repeticoes,
+        "min_ms": min(tempos),
+        "mediana_ms": statistics.median(tempos),
+        "media_ms": statistics.fmean(tempos),
+        "max_ms": max(tempos),
+    }
+
+
+def _pular(motivo):
+    return {"pulado": motivo}
+
+
+def casos_do_catalogo(caminho_cultivos, caminho_eventos, sintetico):
+    df_cultivos = carregar_cultivos(caminho_cultivos, usar_snapshot=False)
+    df_eventos = carregar_eventos(caminho_eventos, usar_snapshot=False)
+    preco_semente_map = get_preco_semente_map(df_cultivos)
+    metricas = [parse_intervalo_data(i) for i in INTERVALOS]
+    plano = gerar_plano(ENTRADA_PLANO, df_cultivos, df_eventos, preco_semente_map, cache=None)
+
+    nomes = np.asarray(df_cultivos["cultivo"]).tolist()
+    dias_cresc = np.asarray(df_cultivos["dias_cresc"], dtype=np.float64)
+    intervalo = np.asarray(df_cultivos["intervalo_colheita"], dtype=np.float64)
+    linhas = list(zip(dias_cresc.tolist(), intervalo.tolist(), nomes))
+
+    casos = {
+        "carregar_cultivos": lambda: carregar_cultivos(caminho_cultivos, usar_snapshot=False),
+        "carregar_eventos": lambda: carregar_eventos(caminho_eventos, usar_snapshot=False),
+        "listar_plantas_possiveis": lambda: [listar_plantas_possiveis(m, df_cultivos) for m in metricas],
+        "calcular_colheitas": lambda: [calcular_colheitas(56, dc, it, n) for dc, it, n in linhas],
+        "calcular_colheitas_vetorizado": lambda: calcular_colheitas_vetorizado(56, dias_cresc, intervalo, nomes),
+        "gerar_plano": lambda: gerar_plano(ENTRADA_PLANO, df_cultivos, df_eventos, preco_semente_map, cache=None),
+        "renderizar_texto_plano": lambda: renderizar_texto_plano(plano),
+    }
+    if not sintetico:
+        casos["carregar_cultivos[snapshot]"] = lambda: carregar_cultivos(caminho_cultivos, usar_snapshot=True)
+
+    if len(plano.cultivos) <= MAX_CULTIVOS_PDF:
+        casos["exportar_plano_pdf"] = lambda: _exportar_pdf(plano)
+    else:
+        casos["exportar_plano_pdf"] = _pular(f"{len(plano.cultivos)} cultivos no plano (limite {MAX_CULTIVOS_PDF})")
+    return casos, {"cultivos": len(df_cultivos), "eventos": len(df_eventos), "cultivos_no_plano": len(plano.cultivos)}
+
+
+def _exportar_pdf(plano):
+    from exportar_pdf import exportar_plano_pdf
+    with tempfile.TemporaryDirectory() as diretorio:
+        exportar_plano_pdf(plano, os.path.join(diretorio, "plano.pdf"))
+
+
+def _gradiente_frio(criar_imagem_gradiente, limpar_cache, *args):
+    limpar_cache()
+    return criar_imagem_gradiente(*args)
+
+
+def casos_de_imagem():
+    try:
+        from utils import criar_imagem_gradiente, _gradiente
+    except ImportError as e:
+        return {"criar_imagem_gradiente": _pular(f"utils indisponível: {e}")}
+    # O aquecimento enche o lru_cache; os casos "frio" o esvaziam a cada repetição para medir a geração.
+    casos = {}
+    for largura, altura in ((400, 300), (1280, 720)):
+        args = (largura, altura, "#f3b874", "#be8053")
+        casos[f"criar_imagem_gradiente[{largura}x{altura}]"] = (
+            lambda args=args: _gradiente_frio(criar_imagem_gradiente, _gradiente.cache_clear, *args))
+        casos[f"criar_imagem_gradiente[{largura}x{altura},cache]"] = lambda args=args: criar_imagem_gradiente(*args)
+    return casos
+
+
+def executar_casos(casos, repeticoes, filtro=None):
+    resultados = {}
+    for nome, caso in casos.items():
+        if filtro and not any(f in nome for f in filtro):
+            continue
+        if isinstance(caso, dict):
+            resultados[nome] = caso
+            continue
+        if nome == "exportar_plano_pdf":
+            from exportar_pdf import carregar_reportlab
+            if not carregar_reportlab():
+                resultados[nome] = _pular("reportlab não instalado")
+                continue
+        resultados[nome] = medir(caso, repeticoes)
+        print(f"   {nome}: {resultados[nome]['mediana_ms']:.2f} ms", file=sys.stderr)
+    return resultados
+
+
+def comparar_com_base(resultados, base, tolerancia=TOLERANCIA_REGRESSAO):
+    comparacao = {}
+    for grupo, casos in resultados.items():
+        for nome, medida in casos.items():
+            anterior = base.get("resultados", {}).get(grupo, {}).get(nome)
+            if not anterior or "mediana_ms" not in anterior or "mediana_ms" not in medida:
+                continue
+            razao = medida["mediana_ms"] / anterior["mediana_ms"] if anterior["mediana_ms"] > 0 else float("inf")
+            comparacao[f"{grupo}/{nome}"] = {
+                "base_ms": anterior["mediana_ms"],
+                "atual_ms": medida["mediana_ms"],
+                "razao": razao,
+                "regressao": razao > 1 + tolerancia,
+            }
+    return comparacao
+
+
+def medir_catalogos(args, resultados, catalogos):
+    print("⏱️ Catálogo distribuído", file=sys.stderr)
+    casos, catalogos["distribuido"] = casos_do_catalogo(CAMINHO_CULTIVOS_CSV, CAMINHO_EVENTOS_CSV, sintetico=False)
+    casos.update(casos_de_imagem())
+    resultados["distribuido"] = executar_casos(casos, args.repeticoes, args.casos)
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        for escala in args.escalas:
+            grupo = f"sintetico_{escala}"
+            print(f"⏱️ Catálogo sintético com {escala} cultivos", file=sys.stderr)
+            caminho_cultivos, caminho_eventos = gerar_catalogo(diretorio, escala, args.semente)
+            casos, catalogos[grupo] = casos_do_catalogo(caminho_cultivos, caminho_eventos, sintetico=True)
+            resultados[grupo] = executar_casos(casos, args.repeticoes, args.casos)
+
+
+def _commit_atual():
+    try:
+        saida = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                               capture_output=True, text=True, timeout=10)
+        return saida.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python benchmarks/executar.py",
+                                     description="Mede o pipeline de planejamento e emite os resultados em JSON.")
+    parser.add_argument("-o", "--saida", default="-", help="Arquivo JSON de resultados (padrão: stdout).")
+    parser.add_argument("--base", help="JSON de uma execução anterior para comparação.")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_REGRESSAO,
+                        help="Aumento relativo da mediana considerado regressão (padrão: 0.10).")
+    parser.add_argument("--repeticoes", type=int, default=5, help="Repetições por caso (padrão: 5).")
+    parser.add_argument("--escalas", nargs="*", type=int, default=ESCALAS_SINTETICAS,
+                        help="Tamanhos dos catálogos sintéticos (padrão: 1000 10000 100000).")
+    parser.add_argument("--casos", nargs="*", help="Roda só os casos cujo nome contém um destes trechos.")
+    parser.add_argument("--semente", type=int, default=0, help="Semente dos catálogos sintéticos.")
+    parser.add_argument("--falhar-em-regressao", action="store_true", help="Sai com código 1 se houver regressão.")
+    args = parser.parse_args(argv)
+
+    resultados = {}
+    catalogos = {}
+
+    # Os módulos medidos avisam pelo stdout; ele fica reservado ao JSON.
+    with contextlib.redirect_stdout(sys.stderr):
+        medir_catalogos(args, resultados, catalogos)
+
+    relatorio = {
+        "versao": VERSAO_RESULTADOS,
+        "data": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit_atual(),
+        "ambiente": {
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "processador": platform.processor() or platform.machine(),
+            "numpy": np.__version__,
+        },
+        "parametros": {"repeticoes": args.repeticoes, "semente": args.semente, "escalas": args.escalas},
+        "catalogos": catalogos,
+        "resultados": resultados,
+    }
+
+    regressoes = []
+    if args.base:
+        with open(args.base, encoding="utf-8") as f:
+            relatorio["comparacao"] = comparar_com_base(resultados, json.load(f), args.tolerancia)
+        regressoes = [nome for nome, c in relatorio["comparacao"].items() if c["regressao"]]
+        for nome in regressoes:
+            c = relatorio["comparacao"][nome]
+            print(f"⚠️ Regressão em {nome}: {c['base_ms']:.2f} ms -> {c['atual_ms']:.2f} ms ({c['razao']:.2f}x)", file=sys.stderr)
+
+    dados = json.dumps(relatorio, ensure_ascii=False, indent=2)
+    if args.saida == "-":
+        print(dados)
+    else:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(dados + "\n")
+    return 1 if regressoes and args.falhar_em_regressao else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
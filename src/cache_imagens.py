@@ -0,0 +1,108 @@
+import os
+import pickle
+import hashlib
+from PIL import Image, ImageEnhance
+from config import (
+    USAR_CACHE_IMAGENS, CACHE_IMAGENS_DIR, IMAGEM_FUNDO_SPLASH, IMAGEM_FUNDO_MAIN, ICONE_FRUTA
+)
+from utils import arredondar_cantos
+
+VERSAO_CACHE_IMAGENS = 1
+RAIO_CANTOS = 24
+TAMANHO_PERSONAGEM = (125, 125)
+POSICAO_PERSONAGEM = (8, 455)
+TAMANHO_ICONE_FRUTA = (32, 32)
+BRILHO_ICONE_PRESSIONADO = 0.7
+
+
+def _sha1_arquivo(caminho):
+    with open(caminho, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def _chave(nome, fontes, parametros):
+    # Muda com o conteúdo das imagens de origem e com qualquer parâmetro do pipeline.
+    partes = [str(VERSAO_CACHE_IMAGENS), nome, repr(parametros)]
+    partes += [_sha1_arquivo(fonte) for fonte in fontes if fonte]
+    return hashlib.sha1("|".join(partes).encode("utf-8")).hexdigest()
+
+def _ler_cache(caminho):
+    if not os.path.exists(caminho):
+        return None
+    try:
+        with open(caminho, "rb") as f:
+            dados = pickle.load(f)
+        if dados.get("versao") != VERSAO_CACHE_IMAGENS:
+            return None
+        return [Image.frombytes(modo, tamanho, pixels) for modo, tamanho, pixels in dados["imagens"]]
+    except Exception as e:
+        print(f"⚠️ Cache de imagem inválido em {caminho}: {e}")
+        return None
+
+def _gravar_cache(caminho, imagens):
+    # Pixels crus: carregar é só copiar bytes, sem decodificar PNG.
+    dados = {
+        "versao": VERSAO_CACHE_IMAGENS,
+        "imagens": [(imagem.mode, imagem.size, imagem.tobytes()) for imagem in imagens],
+    }
+    try:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        caminho_tmp = caminho + ".tmp"
+        with open(caminho_tmp, "wb") as f:
+            pickle.dump(dados, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(caminho_tmp, caminho)
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar o cache de imagem {caminho}: {e}")
+
+def imagens_derivadas(nome, fontes, parametros, gerar):
+    if not USAR_CACHE_IMAGENS:
+        return gerar()
+    try:
+        chave = _chave(nome, fontes, parametros)
+    except OSError:
+        # Origem ilegível: quem gera a imagem decide se é erro ou aviso.
+        return gerar()
+
+    caminho = os.path.join(CACHE_IMAGENS_DIR, f"{nome}_{chave}.pkl")
+    imagens = _ler_cache(caminho)
+    if imagens is None:
+        imagens = gerar()
+        _gravar_cache(caminho, imagens)
+    return imagens
+
+
+def _gerar_fundo_splash():
+    return [arredondar_cantos(Image.open(IMAGEM_FUNDO_SPLASH).convert("RGBA"), RAIO_CANTOS)]
+
+def fundo_splash():
+    return imagens_derivadas("splash", [IMAGEM_FUNDO_SPLASH], (RAIO_CANTOS,), _gerar_fundo_splash)[0]
+
+
+def _gerar_fundo_principal(imagem_personagem):
+    imagem_pil = Image.open(IMAGEM_FUNDO_MAIN).convert("RGBA")
+    if imagem_personagem:
+        try:
+            personagem_pil = Image.open(imagem_personagem).convert("RGBA")
+            personagem_pil = personagem_pil.resize(TAMANHO_PERSONAGEM, Image.Resampling.LANCZOS)
+            imagem_pil.paste(personagem_pil, POSICAO_PERSONAGEM, personagem_pil)
+        except Exception as e:
+            print(f"⚠️ Erro ao carregar personagem: {e}")
+    return [arredondar_cantos(imagem_pil, RAIO_CANTOS)]
+
+def fundo_principal(imagem_personagem=None):
+    # Uma entrada por personagem: a chave inclui o hash do arquivo do personagem.
+    return imagens_derivadas(
+        "fundo_principal", [IMAGEM_FUNDO_MAIN, imagem_personagem],
+        (TAMANHO_PERSONAGEM, POSICAO_PERSONAGEM, RAIO_CANTOS),
+        lambda: _gerar_fundo_principal(imagem_personagem),
+    )[0]
+
+
+def _gerar_icones_fruta():
+    icone_pil = Image.open(ICONE_FRUTA).convert("RGBA").resize(TAMANHO_ICONE_FRUTA, Image.Resampling.LANCZOS)
+    return [icone_pil, ImageEnhance.Brightness(icone_pil).enhance(BRILHO_ICONE_PRESSIONADO)]
+
+def icones_fruta():
+    icone_pil, icone_pressionado_pil = imagens_derivadas(
+        "icone_fruta", [ICONE_FRUTA], (TAMANHO_ICONE_FRUTA, BRILHO_ICONE_PRESSIONADO), _gerar_icones_fruta
+    )
+    return icone_pil, icone_pressionado_pil
@@ -0,0 +1,73 @@
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def estimar_tamanho(valor):
+    if isinstance(valor, np.ndarray):
+        return valor.nbytes + sys.getsizeof(valor)
+    if isinstance(valor, dict):
+        return sys.getsizeof(valor) + sum(estimar_tamanho(k) + estimar_tamanho(v) for k, v in valor.items())
+    if isinstance(valor, (list, tuple)):
+        return sys.getsizeof(valor) + sum(estimar_tamanho(v) for v in valor)
+    return sys.getsizeof(valor)
+
+
+class CacheLRU:
+    def __init__(self, max_entradas=256, max_bytes=8 * 1024 * 1024, medir_tamanho=estimar_tamanho):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.medir_tamanho = medir_tamanho
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes_usados = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+
+    def obter(self, chave):
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is None:
+                self.falhas += 1
+                return None
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return entrada[0]
+
+    def guardar(self, chave, valor):
+        tamanho = self.medir_tamanho(valor)
+        if tamanho > self.max_bytes:
+            return
+        with self._lock:
+            anterior = self._entradas.pop(chave, None)
+            if anterior is not None:
+                self.bytes_usados -= anterior[1]
+            self._entradas[chave] = (valor, tamanho)
+            self.bytes_usados += tamanho
+            while len(self._entradas) > self.max_entradas or self.bytes_usados > self.max_bytes:
+                _, (_, tamanho_antigo) = self._entradas.popitem(last=False)
+                self.bytes_usados -= tamanho_antigo
+                self.descartes += 1
+
+    def limpar(self):
+        with self._lock:
+            self._entradas.clear()
+            self.bytes_usados = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def estatisticas(self):
+        with self._lock:
+            total = self.acertos + self.falhas
+            return {
+                "entradas": len(self._entradas),
+                "bytes": self.bytes_usados,
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "descartes": self.descartes,
+                "taxa_acerto": self.acertos / total if total else 0.0,
+            }
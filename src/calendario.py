@@ -2,7 +2,7 @@ import tkinter as tk
 import time 
 import os
 
-from utils import _hex_to_rgb, _rgb_to_hex, _interpolate_color, animate_hover_bg
+from utils import _hex_to_rgb, _rgb_to_hex, _interpolate_color, animate_hover_bg, cancelar_animacao
 from config import (
     MAIN_CURSOR, POINTER_CURSOR, FONTE_APP,
     ESTACOES, DIAS_POR_ESTACAO, DIAS_SEMANA,
@@ -86,12 +86,7 @@ def abrir_calendario_popup(janela, botao_calendario, som_hover_callback=None):
 
     def atualizar_dias():
         for d, lbl in dias_labels.items():
-            if hasattr(lbl, "_animation_id"):
-                try:
-                    lbl.after_cancel(lbl._animation_id)
-                    delattr(lbl, "_animation_id")
-                except (tk.TclError, AttributeError):
-                    pass
+            cancelar_animacao(lbl)
             lbl.config(bg=COR_CAL_DIA_BG, fg=COR_CAL_DIA_FG)
 
         inicio = janela.intervalo_selecionado["inicio"]
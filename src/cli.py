@@ -0,0 +1,192 @@
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import argparse
+import csv
+import json
+import time
+
+from unidecode import unidecode
+from config import CAMINHO_CULTIVOS_CSV, CAMINHO_EVENTOS_CSV, USAR_TABELA_RESPOSTAS
+from logica import carregar_cultivos, carregar_eventos, get_preco_semente_map
+from tabela_respostas import obter_tabela_respostas
+from lote import processar_lote, MODOS_LOTE
+from instrumentacao import REGISTRO
+
+CAMPOS_ENTRADA = ["opcao_estrategia", "quantidade", "data_inicio"]
+CAMPOS_OPCIONAIS = ["orcamento", "sucessao", "ouro_inicial", "sensibilidade", "semente"]
+CAMPOS_SAIDA = ["indice", "opcao_estrategia", "quantidade", "data_inicio", "plano", "erro"]
+
+
+def _formato_por_extensao(caminho, padrao="jsonl"):
+    if caminho and caminho != "-" and caminho.lower().endswith(".csv"):
+        return "csv"
+    return padrao
+
+
+def _normalizar_requisicao(registro):
+    quantidade = registro.get("quantidade")
+    if isinstance(quantidade, str) and quantidade.strip().lstrip("-").isdigit():
+        registro["quantidade"] = int(quantidade)
+    orcamento = registro.get("orcamento")
+    if isinstance(orcamento, str):
+        orcamento = orcamento.strip()
+        if not orcamento:
+            registro.pop("orcamento")
+        elif orcamento.lower() in ("none", "sem limite"):
+            registro["orcamento"] = None
+        else:
+            try:
+                registro["orcamento"] = float(orcamento)
+            except ValueError:
+                pass
+    ouro_inicial = registro.get("ouro_inicial")
+    if isinstance(ouro_inicial, str):
+        if not ouro_inicial.strip():
+            registro.pop("ouro_inicial")
+        else:
+            try:
+                registro["ouro_inicial"] = float(ouro_inicial)
+            except ValueError:
+                pass
+    for campo in ("sensibilidade", "semente"):
+        valor = registro.get(campo)
+        if isinstance(valor, str):
+            valor = unidecode(valor.strip().lower())
+            if valor.isdigit():
+                registro[campo] = int(valor)
+            elif campo == "sensibilidade":
+                registro[campo] = valor in ("sim", "s", "true")
+            else:
+                registro.pop(campo)
+    sucessao = registro.get("sucessao")
+    if isinstance(sucessao, str):
+        registro["sucessao"] = unidecode(sucessao.strip().lower()) in ("1", "sim", "s", "true")
+    return registro
+
+
+def ler_requisicoes_jsonl(arquivo):
+    for numero, linha in enumerate(arquivo, start=1):
+        linha = linha.strip()
+        if not linha:
+            continue
+        try:
+            registro = json.loads(linha)
+        except json.JSONDecodeError as e:
+            print(f"⚠️ Linha {numero}: JSON inválido ({e}).", file=sys.stderr)
+            registro = {}
+        yield _normalizar_requisicao(registro)
+
+
+def ler_requisicoes_csv(arquivo, separador=";"):
+    for registro in csv.DictReader(arquivo, delimiter=separador):
+        requisicao = {campo: registro.get(campo) for campo in CAMPOS_ENTRADA}
+        requisicao.update({campo: registro[campo] for campo in CAMPOS_OPCIONAIS if campo in registro})
+        yield _normalizar_requisicao(requisicao)
+
+
+def _linha_saida(resultado):
+    dados_entrada = resultado["dados_entrada"]
+    return {
+        "indice": resultado["indice"],
+        "opcao_estrategia": dados_entrada.get("opcao_estrategia"),
+        "quantidade": dados_entrada.get("quantidade"),
+        "data_inicio": dados_entrada.get("data_inicio"),
+        "plano": resultado["plano"],
+        "erro": resultado["erro"],
+    }
+
+
+def escrever_resultados(resultados, arquivo, formato="jsonl", separador=";"):
+    total = 0
+    erros = 0
+    if formato == "csv":
+        escritor = csv.DictWriter(arquivo, fieldnames=CAMPOS_SAIDA, delimiter=separador)
+        escritor.writeheader()
+
+        def escrever(linha):
+            if isinstance(linha["plano"], dict):
+                linha["plano"] = json.dumps(linha["plano"], ensure_ascii=False)
+            escritor.writerow(linha)
+    else:
+        escrever = lambda linha: arquivo.write(json.dumps(linha, ensure_ascii=False) + "\n")
+
+    for resultado in resultados:
+        escrever(_linha_saida(resultado))
+        total += 1
+        if resultado["erro"]:
+            erros += 1
+    arquivo.flush()
+    return total, erros
+
+
+def criar_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Gera planos de cultivo sem interface gráfica a partir de requisições em JSONL ou CSV."
+    )
+    parser.add_argument("entrada", nargs="?", default="-", help="Arquivo de requisições (padrão: stdin).")
+    parser.add_argument("-o", "--saida", default="-", help="Arquivo de saída (padrão: stdout).")
+    parser.add_argument("--formato-entrada", choices=["jsonl", "csv"], help="Padrão: pela extensão, senão jsonl.")
+    parser.add_argument("--formato-saida", choices=["jsonl", "csv"], help="Padrão: pela extensão, senão jsonl.")
+    parser.add_argument("--formato-plano", choices=["texto", "json"], default="texto",
+                        help="Plano como texto formatado ou como objeto JSON estruturado (padrão: texto).")
+    parser.add_argument("--separador", default=";", help="Separador dos arquivos CSV (padrão: ';').")
+    parser.add_argument("--modo", choices=MODOS_LOTE, default="serial", help="Execução do lote (padrão: serial).")
+    parser.add_argument("--trabalhadores", type=int, default=None, help="Número de processos/threads.")
+    parser.add_argument("--desordenado", action="store_true", help="Escreve os resultados à medida que ficam prontos.")
+    parser.add_argument("--sem-tabela", action="store_true", help="Não usa a tabela de respostas pré-calculada.")
+    parser.add_argument("--cultivos", default=CAMINHO_CULTIVOS_CSV, help="Caminho do Cultivos.csv.")
+    parser.add_argument("--eventos", default=CAMINHO_EVENTOS_CSV, help="Caminho do Estações e Festivais.csv.")
+    return parser
+
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+
+    df_cultivos = carregar_cultivos(args.cultivos)
+    df_eventos = carregar_eventos(args.eventos)
+    preco_semente_map = get_preco_semente_map(df_cultivos)
+    tabela_respostas = None
+    if USAR_TABELA_RESPOSTAS and not args.sem_tabela:
+        tabela_respostas = obter_tabela_respostas(df_cultivos)
+
+    formato_entrada = args.formato_entrada or _formato_por_extensao(args.entrada)
+    formato_saida = args.formato_saida or _formato_por_extensao(args.saida)
+
+    entrada = sys.stdin if args.entrada == "-" else open(args.entrada, encoding="utf-8-sig", newline="")
+    saida = sys.stdout if args.saida == "-" else open(args.saida, "w", encoding="utf-8", newline="")
+    inicio = time.perf_counter()
+    try:
+        if formato_entrada == "csv":
+            requisicoes = ler_requisicoes_csv(entrada, args.separador)
+        else:
+            requisicoes = ler_requisicoes_jsonl(entrada)
+
+        resultados = processar_lote(
+            requisicoes, df_cultivos, df_eventos, preco_semente_map, tabela_respostas,
+            modo=args.modo, max_trabalhadores=args.trabalhadores, ordenado=not args.desordenado,
+            formato=args.formato_plano
+        )
+        total, erros = escrever_resultados(resultados, saida, formato_saida, args.separador)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout:
+            saida.close()
+
+    duracao = time.perf_counter() - inicio
+    taxa = total / duracao if duracao > 0 else 0.0
+    print(f"✅ {total} plano(s) gerado(s), {erros} com erro, em {duracao:.2f} s ({taxa:.0f}/s).", file=sys.stderr)
+    if REGISTRO.habilitado:
+        print(REGISTRO.texto_resumo(), file=sys.stderr)
+        REGISTRO.despejar()
+    return 1 if erros else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
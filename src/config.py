@@ -12,6 +12,11 @@ else:
 ASSETS_DIR = os.path.join(PROJECT_ROOT, "assets")
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 
+if getattr(sys, 'frozen', False):
+    CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(sys.executable)), "cache")
+else:
+    CACHE_DIR = os.path.join(PROJECT_ROOT, "cache")
+
 def get_cursor_spec(filename):
   
     cursor_file = os.path.join(ASSETS_DIR, filename)
@@ -38,6 +43,26 @@ CAMINHO_IMAGENS = os.path.join(ASSETS_DIR, "images")
 CAMINHO_IMAGENS_PERSONAGENS = os.path.join(CAMINHO_IMAGENS, "images personagens")
 CAMINHO_CULTIVOS_CSV = os.path.join(DATA_DIR, "Cultivos.csv")
 CAMINHO_EVENTOS_CSV = os.path.join(DATA_DIR, "Estações e Festivais.csv")
+CACHE_TABELAS_RESPOSTAS_DIR = os.path.join(CACHE_DIR, "tabelas_respostas")
+USAR_SNAPSHOTS = True
+USAR_TABELA_RESPOSTAS = True
+# Acima disso a tabela do ano demora segundos e centenas de MB; os planos são calculados sob demanda.
+LIMITE_CULTIVOS_TABELA_RESPOSTAS = 300
+TAMANHO_CACHE_PLANOS = 512
+LIMITE_BYTES_CACHE_PLANOS = 16 * 1024 * 1024
+TAMANHO_BLOCO_LOTE = 64
+HOST_SERVIDOR = "127.0.0.1"
+PORTA_SERVIDOR = 8765
+TRABALHADORES_SERVIDOR = 8
+JANELA_METRICAS_LATENCIA = 2048
+INTERVALO_FILA_UI_MS = 30
+TAMANHO_CACHE_GRADIENTES = 32
+INTERVALO_ANIMACAO_MS = 16
+TAMANHO_CACHE_RAMPAS_CORES = 64
+# Gerar um gradiente é mais rápido que ler o PNG do disco; a persistência fica para depuração.
+PERSISTIR_GRADIENTES = os.environ.get("FARM_PERSISTIR_GRADIENTES") == "1"
+USAR_CACHE_IMAGENS = os.environ.get("FARM_CACHE_IMAGENS", "1") != "0"
+CACHE_IMAGENS_DIR = os.path.join(CACHE_DIR, "imagens")
 
 FONTE_APP = "Londrina Solid"
 FONTE_ARQUIVO = os.path.join(ASSETS_DIR, "LondrinaSolid-Regular.ttf")
@@ -52,6 +77,12 @@ IMAGEM_FUNDO_SPLASH = os.path.join(CAMINHO_IMAGENS, "img_projeto.png")
 IMAGEM_FUNDO_MAIN = os.path.join(CAMINHO_IMAGENS, "img_tela_2.png")
 ICONE_FRUTA = os.path.join(CAMINHO_IMAGENS, "fruta_icone.png")
 
+AUDIO_HABILITADO = os.environ.get("FARM_AUDIO", "1") != "0"
+RELATORIO_IMPORTACAO = os.environ.get("FARM_RELATORIO_IMPORTACAO") == "1"
+INSTRUMENTACAO_HABILITADA = os.environ.get("FARM_INSTRUMENTACAO") == "1"
+CAMINHO_LOG_INSTRUMENTACAO = os.path.join(CACHE_DIR, "instrumentacao.jsonl")
+MODULOS_PESADOS = ["numpy", "pandas", "PIL", "pygame", "reportlab"]
+
 MUSICA_TEMA_SPLASH = os.path.join(ASSETS_DIR, "01. Stardew Valley Overture (mp3cut.net).mp3")
 MUSICA_TEMA_SISTEMA = os.path.join(ASSETS_DIR, "11. Distant Banjo (mp3cut.net).mp3")
 SOM_HOVER = os.path.join(ASSETS_DIR, "Voicy_List selection.mp3")
@@ -59,6 +90,36 @@ SOM_HOVER = os.path.join(ASSETS_DIR, "Voicy_List selection.mp3")
 ESTACOES = ["Primavera", "Verão", "Outono", "Inverno"]
 DIAS_POR_ESTACAO = 28
 DIAS_SEMANA = ["S", "T", "Q", "Q", "S", "S", "D"]
+# Sementes de morango só ficam à venda a partir do Festival do Ovo (Primavera D13), plantio no dia seguinte.
+DIA_PLANTIO_MINIMO_MORANGO = 14
+
+# Correções de contagem de colheitas conferidas no jogo.
+# Chave: (colheita múltipla?, dias_totais, dias_cresc, colheitas calculadas) -> colheitas reais
+AJUSTES_COLHEITAS_POR_CICLO = {
+    (False, 28, 4, 7): 6,
+    (False, 28, 7, 4): 3,
+}
+# Chave: (colheita múltipla?, dias_totais, cultivo, colheitas calculadas) -> colheitas reais
+AJUSTES_COLHEITAS_POR_CULTIVO = {
+    (False, 56, "girassol", 7): 6,
+    (True, 28, "vagem", 7): 6,
+    (True, 28, "grao de cafe", 10): 9,
+    (True, 28, "morango", 6): 5,
+    (True, 28, "lupulo", 18): 17,
+    (True, 28, "amaranto", 4): 3,
+    (True, 28, "brocolis", 6): 5,
+    (True, 56, "grao de cafe", 24): 23,
+}
+
+# Análise de sensibilidade: variação relativa do preço de venda, multiplicadores de qualidade
+# (normal, prata, ouro, irídio) com suas chances e chance de um item extra por colheita.
+TENTATIVAS_SENSIBILIDADE = 5000
+# Cada tentativa ocupa algumas linhas float64 por cultivo; o limite protege o servidor de pedidos gigantes.
+MAX_TENTATIVAS_SENSIBILIDADE = 50000
+VARIACAO_PRECO_SENSIBILIDADE = 0.15
+MULTIPLICADORES_QUALIDADE = [1.0, 1.25, 1.5, 2.0]
+CHANCES_QUALIDADE = [0.77, 0.15, 0.07, 0.01]
+CHANCE_COLHEITA_EXTRA = 0.05
 
 COR_TRANSPARENTE = "#abcdef"
 COR_FUNDO_CAMPO = '#f3b874'
@@ -0,0 +1,191 @@
+import os
+import threading
+from config import FONTE_ARQUIVO, FONT_NAME_PDF, COR_PDF_TITULO, COR_PDF_SUBTITULO, COR_PDF_TEXTO
+from instrumentacao import cronometrar
+from tratamento_menssagem import descrever_impacto, formatar_gold, formatar_percentual, LIMITE_LINHAS_SENSIBILIDADE
+
+# reportlab só é importado na primeira exportação; a fonte e os estilos são criados uma única vez.
+REPORTLAB_AVAILABLE = None
+FONTE_PDF = FONT_NAME_PDF
+_ESTILOS = None
+_LOCK_REPORTLAB = threading.Lock()
+
+
+def carregar_reportlab():
+    if REPORTLAB_AVAILABLE is not None:
+        return REPORTLAB_AVAILABLE
+    with _LOCK_REPORTLAB:
+        return _carregar_reportlab()
+
+
+def _carregar_reportlab():
+    global REPORTLAB_AVAILABLE, FONTE_PDF
+    global SimpleDocTemplate, Paragraph, Spacer, ParagraphStyle, A4, inch, HexColor
+    if REPORTLAB_AVAILABLE is not None:
+        return REPORTLAB_AVAILABLE
+
+    try:
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.lib.colors import HexColor
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+    except ImportError:
+        REPORTLAB_AVAILABLE = False
+        print("⚠️ Biblioteca ReportLab não encontrada. A exportação de PDF será desativada.")
+        return False
+
+    try:
+        if os.path.exists(FONTE_ARQUIVO):
+            pdfmetrics.registerFont(TTFont(FONT_NAME_PDF, FONTE_ARQUIVO))
+            print(f"✅ Fonte '{FONT_NAME_PDF}' registrada com sucesso no ReportLab.")
+        else:
+            raise FileNotFoundError("Arquivo da fonte não encontrado.")
+    except Exception as e:
+        print(f"⚠️ Aviso: Não foi possível registrar a fonte '{FONT_NAME_PDF}' para o PDF. Usando 'Helvetica'. Erro: {e}")
+        FONTE_PDF = 'Helvetica'
+    REPORTLAB_AVAILABLE = True
+    return True
+
+
+def _estilos():
+    global _ESTILOS
+    if _ESTILOS is not None:
+        return _ESTILOS
+
+    style_title = ParagraphStyle(name='TitleStyle', fontName=FONTE_PDF, fontSize=20,
+                                 textColor=HexColor(COR_PDF_TITULO), alignment=1, spaceAfter=12)
+    style_heading = ParagraphStyle(name='HeadingStyle', fontName=FONTE_PDF, fontSize=14,
+                                   textColor=HexColor(COR_PDF_SUBTITULO), spaceBefore=10, spaceAfter=6, alignment=0)
+    style_body = ParagraphStyle(name='BodyStyle', fontName=FONTE_PDF, fontSize=10,
+                                textColor=HexColor(COR_PDF_TEXTO), leading=14, alignment=0)
+    style_body_indent = ParagraphStyle(name='BodyIndentStyle', parent=style_body,
+                                       leftIndent=0.25 * inch, firstLineIndent=0)
+    _ESTILOS = (style_title, style_heading, style_body, style_body_indent)
+    return _ESTILOS
+
+
+def gerar_flowables(plano):
+    style_title, style_heading, style_body, style_body_indent = _estilos()
+    espaco = lambda: Spacer(1, 0.1 * inch)
+
+    yield Paragraph("Plano de Colheita", style_title)
+    yield Paragraph(f"📑 Plano de Cultivo Otimizado | {plano.opcao_estrategia}", style_heading)
+    yield Paragraph(f"Área de Plantio: {plano.quantidade_quadrados} Quadrado(s)", style_body)
+    yield Paragraph(f"Período de Análise: {plano.periodo}", style_body)
+    yield Paragraph(f"Dias Úteis no Período: {plano.dias_totais}", style_body)
+    yield espaco()
+
+    if not plano.cultivos:
+        yield Paragraph("Cultivos", style_body)
+        yield Paragraph("🌿 Nenhuma planta pode ser colhida neste período. Tente aumentar o intervalo ou rever as sementes disponíveis!", style_body)
+    else:
+        yield Paragraph("🌿Cultivos Otimizados - Ordenado por Lucro🌿", style_heading)
+        for i, c in enumerate(plano.cultivos):
+            yield espaco()
+            yield Paragraph(f"{i+1}. {c.planta.title()}", style_body)
+            yield Paragraph(f"▪️ Colheitas Possíveis: {c.colheitas} vezes", style_body_indent)
+            yield Paragraph(f"▪️ Custo Total de Sementes: {formatar_gold(c.custo_sementes)} G", style_body_indent)
+            yield Paragraph(f"▪️ Lucro Total Projetado: {formatar_gold(c.lucro_total)} G", style_body_indent)
+
+    if plano.alocacao is not None:
+        alocacao = plano.alocacao
+        limite = "sem limite" if alocacao["orcamento"] is None else f"{formatar_gold(alocacao['orcamento'])} G"
+        yield espaco()
+        yield Paragraph(f"🧮Divisão Otimizada da Área (Orçamento: {limite})🧮", style_heading)
+        for a in alocacao["alocacao"]:
+            yield Paragraph(f"- {a['planta'].title()}: {a['quadrados']} Quadrado(s)", style_body)
+            yield Paragraph(f"▪️ Sementes: {formatar_gold(a['custo_sementes'])} G | Lucro Líquido: {formatar_gold(a['lucro_liquido'])} G", style_body_indent)
+        yield Paragraph(f"Total: {formatar_gold(alocacao['custo_total'])} G em sementes, "
+                        f"{formatar_gold(alocacao['lucro_liquido'])} G de lucro líquido", style_body)
+
+    if plano.sucessao is not None:
+        sucessao = plano.sucessao
+        yield espaco()
+        yield Paragraph("🔁Sucessão de Cultivos no Mesmo Quadrado🔁", style_heading)
+        for i, e in enumerate(sucessao["etapas"]):
+            yield Paragraph(f"{i+1}. {e['planta'].title()}: {e['plantio']} -> {e['ultimo_dia']} ({e['colheitas']} colheita(s))", style_body)
+            yield Paragraph(f"▪️ Sementes: {formatar_gold(e['custo_sementes'])} G | Lucro Líquido: {formatar_gold(e['lucro_liquido'])} G por quadrado", style_body_indent)
+        yield Paragraph(f"Total: {formatar_gold(sucessao['custo_total'])} G em sementes, "
+                        f"{formatar_gold(sucessao['lucro_liquido'])} G de lucro líquido em {sucessao['quantidade_quadrados']} quadrado(s)", style_body)
+
+    if plano.simulacao is not None:
+        simulacao = plano.simulacao
+        yield espaco()
+        yield Paragraph(f"💰Simulação de Caixa (Ouro Inicial: {formatar_gold(simulacao['ouro_inicial'])} G)💰", style_heading)
+        for c in simulacao["compras"]:
+            yield Paragraph(f"- {c['dia']}: {c['quadrados']} Quadrado(s) de {c['planta'].title()} por {formatar_gold(c['custo'])} G", style_body)
+        if simulacao["lojas_fechadas"]:
+            yield Paragraph(f"Lojas fechadas em: {', '.join(simulacao['lojas_fechadas'])}", style_body_indent)
+        yield Paragraph(f"Ouro Final: {formatar_gold(simulacao['ouro_final'])} G "
+                        f"(lucro de {formatar_gold(simulacao['lucro'])} G, até {simulacao['pico_quadrados_plantados']} quadrado(s) plantados)", style_body)
+
+    if plano.sensibilidade is not None:
+        sensibilidade = plano.sensibilidade
+        yield espaco()
+        yield Paragraph(f"🎲Análise de Sensibilidade ({sensibilidade['tentativas']} sorteios)🎲", style_heading)
+        for c in sensibilidade["cultivos"][:LIMITE_LINHAS_SENSIBILIDADE]:
+            yield Paragraph(f"- {c['planta'].title()}: média {formatar_gold(c['media'])} G por quadrado", style_body)
+            yield Paragraph(f"▪️ P5 {formatar_gold(c['p5'])} G | P50 {formatar_gold(c['p50'])} G | P95 {formatar_gold(c['p95'])} G"
+                            f" | 1º lugar em {formatar_percentual(c['chance_primeiro'])} dos sorteios", style_body_indent)
+
+    if plano.festivais is None:
+        yield Paragraph(f"[AVISO: Falha ao carregar Eventos/Festivais. Erro: {plano.erro_festivais}]", style_body_indent)
+    elif plano.festivais:
+        yield espaco()
+        yield Paragraph("🎉Eventos e Festivais no Período🎉", style_heading)
+        for f in plano.festivais:
+            status_icon, status_text = descrever_impacto(f.afeta_cultivo)
+            obs = str(f.obs).capitalize().replace("nan", "N/A")
+            yield espaco()
+            yield Paragraph(f"- {f.estacao.capitalize()} D.{f.dia} - {f.festival.capitalize()}", style_body)
+            yield Paragraph(f"> Impacto: {status_icon} {status_text}", style_body_indent)
+            yield Paragraph(f"({obs})", style_body_indent)
+    else:
+        yield Paragraph("✅ Nenhuma interrupção por festival no período.", style_body_indent)
+
+
+def _rodape(canvas, doc):
+    canvas.saveState()
+    try:
+        canvas.setFont(FONTE_PDF, 9)
+    except:
+        canvas.setFont('Helvetica', 9)
+    page_text = f"Página {canvas.getPageNumber()}"
+    canvas.drawRightString(doc.width + doc.leftMargin - (0.5*inch),
+                           doc.bottomMargin / 2, page_text)
+    canvas.restoreState()
+
+
+@cronometrar("pdf")
+def exportar_plano_pdf(plano, caminho, ao_progredir=None):
+    # ao_progredir(fracao, paginas) é chamado na thread que gera o PDF.
+    if not carregar_reportlab():
+        raise ImportError("A biblioteca 'reportlab' é necessária para exportar PDF.")
+
+    doc = SimpleDocTemplate(caminho, pagesize=A4,
+                            rightMargin=0.75*inch, leftMargin=0.75*inch,
+                            topMargin=0.75*inch, bottomMargin=0.75*inch)
+    flowables = list(gerar_flowables(plano))
+
+    if ao_progredir is not None:
+        estado = {"total": len(flowables) or 1, "paginas": 0, "percentual": -1}
+
+        def progresso(tipo, valor):
+            if tipo == "PAGE":
+                estado["paginas"] = valor
+            elif tipo == "PROGRESS":
+                # Tabelas quebradas entre páginas viram flowables extras: a contagem pode passar do total inicial.
+                percentual = min(100, 100 * valor // estado["total"])
+                if percentual != estado["percentual"]:
+                    estado["percentual"] = percentual
+                    ao_progredir(percentual / 100, estado["paginas"])
+            elif tipo == "FINISHED":
+                ao_progredir(1.0, estado["paginas"])
+
+        doc.setProgressCallBack(progresso)
+
+    doc.build(flowables, onFirstPage=_rodape, onLaterPages=_rodape)
+    return caminho
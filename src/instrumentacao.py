@@ -0,0 +1,113 @@
+import os
+import json
+import time
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+from config import INSTRUMENTACAO_HABILITADA, CAMINHO_LOG_INSTRUMENTACAO
+
+# Etapas medidas no caminho de um plano, na ordem em que acontecem.
+ETAPAS = ["parse", "contagem_dias", "filtro_estacao", "colheitas", "festivais", "render_texto", "insercao_ui", "pdf"]
+
+
+class RegistroInstrumentacao:
+    def __init__(self, habilitado=INSTRUMENTACAO_HABILITADA):
+        self.habilitado = habilitado
+        self._etapas = {}
+        self._lock = threading.Lock()
+
+    def registrar(self, etapa, duracao):
+        with self._lock:
+            dados = self._etapas.get(etapa)
+            if dados is None:
+                dados = self._etapas[etapa] = {"chamadas": 0, "total": 0.0, "max": 0.0}
+            dados["chamadas"] += 1
+            dados["total"] += duracao
+            if duracao > dados["max"]:
+                dados["max"] = duracao
+
+    @contextmanager
+    def medir(self, etapa):
+        if not self.habilitado:
+            yield
+            return
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.registrar(etapa, time.perf_counter() - inicio)
+
+    def cronometrar(self, etapa):
+        # Desligado, o custo por chamada é só a checagem da flag.
+        def decorador(funcao):
+            @wraps(funcao)
+            def envolvida(*args, **kwargs):
+                if not self.habilitado:
+                    return funcao(*args, **kwargs)
+                inicio = time.perf_counter()
+                try:
+                    return funcao(*args, **kwargs)
+                finally:
+                    self.registrar(etapa, time.perf_counter() - inicio)
+            return envolvida
+        return decorador
+
+    def resumo(self):
+        with self._lock:
+            copia = {etapa: dict(dados) for etapa, dados in self._etapas.items()}
+        ordem = {etapa: i for i, etapa in enumerate(ETAPAS)}
+        return {
+            etapa: {
+                "chamadas": dados["chamadas"],
+                "total_ms": dados["total"] * 1000,
+                "media_ms": dados["total"] / dados["chamadas"] * 1000,
+                "max_ms": dados["max"] * 1000,
+            }
+            for etapa, dados in sorted(copia.items(), key=lambda item: ordem.get(item[0], len(ETAPAS)))
+        }
+
+    def limpar(self):
+        with self._lock:
+            self._etapas.clear()
+
+    def snapshot_memoria(self, limite=10):
+        # O primeiro pedido liga o tracemalloc; as alocações só aparecem a partir daí.
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        atual, pico = tracemalloc.get_traced_memory()
+        estatisticas = tracemalloc.take_snapshot().statistics("lineno")
+        return {
+            "atual_kb": atual / 1024,
+            "pico_kb": pico / 1024,
+            "maiores": [
+                {"local": str(e.traceback[0]), "tamanho_kb": e.size / 1024, "blocos": e.count}
+                for e in estatisticas[:limite]
+            ],
+        }
+
+    def texto_resumo(self):
+        linhas = [f"{'Etapa':<16}{'Chamadas':>9}{'Total ms':>11}{'Média ms':>11}{'Máx ms':>10}"]
+        for etapa, d in self.resumo().items():
+            linhas.append(f"{etapa:<16}{d['chamadas']:>9}{d['total_ms']:>11.2f}{d['media_ms']:>11.3f}{d['max_ms']:>10.2f}")
+        if len(linhas) == 1:
+            linhas.append("Nenhuma etapa medida ainda.")
+        return "\n".join(linhas)
+
+    def despejar(self, caminho=CAMINHO_LOG_INSTRUMENTACAO, memoria=None):
+        registro = {"data": time.strftime("%Y-%m-%dT%H:%M:%S"), "pid": os.getpid(), "etapas": self.resumo()}
+        if memoria is not None:
+            registro["memoria"] = memoria
+        try:
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            with open(caminho, "a", encoding="utf-8") as f:
+                f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+            return caminho
+        except OSError as e:
+            print(f"⚠️ Não foi possível gravar a instrumentação em {caminho}: {e}")
+            return None
+
+
+REGISTRO = RegistroInstrumentacao()
+medir = REGISTRO.medir
+cronometrar = REGISTRO.cronometrar
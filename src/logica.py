@@ -1,8 +1,16 @@
-import pandas as pd
 from unidecode import unidecode
 import os
+import math
+import hashlib
+import pickle
+import threading
 import numpy as np
-from config import DATA_DIR, CAMINHO_CULTIVOS_CSV, CAMINHO_EVENTOS_CSV, ESTACOES, DIAS_POR_ESTACAO
+from tabela_colunar import TabelaColunar, de_dataframe, filtrar_linhas
+from instrumentacao import cronometrar
+from config import (
+    DATA_DIR, CACHE_DIR, CAMINHO_CULTIVOS_CSV, CAMINHO_EVENTOS_CSV, ESTACOES, DIAS_POR_ESTACAO, USAR_SNAPSHOTS,
+    AJUSTES_COLHEITAS_POR_CICLO, AJUSTES_COLHEITAS_POR_CULTIVO, DIA_PLANTIO_MINIMO_MORANGO
+)
 
 if not os.path.exists(CAMINHO_CULTIVOS_CSV) or not os.path.exists(CAMINHO_EVENTOS_CSV):
     SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -14,22 +22,122 @@ if not os.path.exists(CAMINHO_CULTIVOS_CSV) or not os.path.exists(CAMINHO_EVENTO
         CAMINHO_EVENTOS_CSV = os.path.join(ALT_DATA_DIR, "Estações e Festivais.csv")
 
 
-def carregar_cultivos(caminho=CAMINHO_CULTIVOS_CSV):
-    caminho_abs = os.path.abspath(caminho)
-    if not os.path.exists(caminho_abs):
-        caminho_alt = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Cultivos.csv")
-        if not os.path.exists(caminho_alt):
-            raise FileNotFoundError(f"Cultivos.csv não encontrado. Caminhos tentados: {caminho_abs} e {caminho_alt}")
-        caminho_abs = caminho_alt
+VERSAO_SNAPSHOT = 2
+
+
+def versao_arquivo(caminho):
+    with open(caminho, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
 
+def _hash_conteudo(tabela):
+    import pandas as pd
+    resumo = hashlib.sha1()
+    for coluna in tabela.columns:
+        valores = np.asarray(tabela[coluna])
+        resumo.update(str(coluna).encode("utf-8"))
+        if valores.dtype == object:
+            resumo.update(pd.util.hash_array(valores, categorize=False).tobytes())
+        else:
+            resumo.update(str(valores.dtype).encode("utf-8"))
+            resumo.update(np.ascontiguousarray(valores).tobytes())
+    return resumo.hexdigest()
+
+def versao_dados(tabela):
+    # Chave de cache pelo conteúdo, recalculada a cada consulta: o id() de uma tabela descartada pode ser
+    # reaproveitado, e edições no lugar (ou cópias com attrs herdados) precisam gerar uma versão nova.
+    return _hash_conteudo(tabela)
+
+def _caminho_snapshot(caminho_csv):
+    nome = os.path.splitext(os.path.basename(caminho_csv))[0]
+    return os.path.join(CACHE_DIR, f"{nome}.snapshot.pkl")
+
+def _ler_snapshot(caminho_csv):
+    caminho_snapshot = _caminho_snapshot(caminho_csv)
+    if not os.path.exists(caminho_snapshot):
+        return None
+    try:
+        with open(caminho_snapshot, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception as e:
+        print(f"⚠️ Snapshot inválido em {caminho_snapshot}: {e}")
+        return None
+    if snapshot.get("versao") != VERSAO_SNAPSHOT:
+        return None
+
+    fonte = snapshot["fonte"]
+    estado = os.stat(caminho_csv)
+    if estado.st_size != fonte["tamanho"]:
+        return None
+    if estado.st_mtime_ns != fonte["mtime_ns"]:
+        if versao_arquivo(caminho_csv) != fonte["sha1"]:
+            return None
+        fonte["mtime_ns"] = estado.st_mtime_ns
+        _gravar_snapshot(caminho_csv, snapshot)
+    return snapshot
+
+def _gravar_snapshot(caminho_csv, snapshot):
+    caminho_snapshot = _caminho_snapshot(caminho_csv)
+    try:
+        os.makedirs(os.path.dirname(caminho_snapshot), exist_ok=True)
+        caminho_tmp = caminho_snapshot + ".tmp"
+        with open(caminho_tmp, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(caminho_tmp, caminho_snapshot)
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar o snapshot {caminho_snapshot}: {e}")
+
+def _snapshot_de_tabela(tabela, caminho_csv):
+    estado = os.stat(caminho_csv)
+    return {
+        "versao": VERSAO_SNAPSHOT,
+        "fonte": {"tamanho": estado.st_size, "mtime_ns": estado.st_mtime_ns, "sha1": tabela.attrs["versao_dados"]},
+        "colunas": tabela.colunas(),
+    }
+
+def _tabela_de_snapshot(snapshot):
+    return TabelaColunar(snapshot["colunas"], {"versao_dados": snapshot["fonte"]["sha1"]})
+
+def _carregar_com_snapshot(caminho_abs, ler_csv, usar_snapshot):
+    if usar_snapshot:
+        snapshot = _ler_snapshot(caminho_abs)
+        if snapshot is not None:
+            return _tabela_de_snapshot(snapshot)
+
+    tabela = de_dataframe(ler_csv(caminho_abs))
+    tabela.attrs["versao_dados"] = versao_arquivo(caminho_abs)
+    if usar_snapshot:
+        _gravar_snapshot(caminho_abs, _snapshot_de_tabela(tabela, caminho_abs))
+    return tabela
+
+def _ler_cultivos_csv(caminho_abs):
+    import pandas as pd
     df = pd.read_csv(caminho_abs, sep=";")
     for coluna in df.select_dtypes(include="object").columns:
         df[coluna] = df[coluna].astype(str).str.strip().str.lower().apply(unidecode)
     for coluna in ["dias_cresc", "intervalo_colheita", "preco_semente", "preco_venda"]:
         df[coluna] = pd.to_numeric(df[coluna], errors="coerce")
+    df["mascara_estacao"] = df["estacao"].map(mascara_estacoes).astype(np.uint8)
     return df
 
-def carregar_eventos(caminho=CAMINHO_EVENTOS_CSV):
+def _ler_eventos_csv(caminho_abs):
+    import pandas as pd
+    df = pd.read_csv(caminho_abs, sep=";")
+    for coluna in df.select_dtypes(include="object").columns:
+        df[coluna] = df[coluna].astype(str).str.strip().str.lower().apply(unidecode)
+    df["dia_festival"] = pd.to_numeric(df["dia_festival"], errors="coerce").astype("Int64")
+    return df
+
+def carregar_cultivos(caminho=CAMINHO_CULTIVOS_CSV, usar_snapshot=USAR_SNAPSHOTS):
+    caminho_abs = os.path.abspath(caminho)
+    if not os.path.exists(caminho_abs):
+        caminho_alt = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Cultivos.csv")
+        if not os.path.exists(caminho_alt):
+            raise FileNotFoundError(f"Cultivos.csv não encontrado. Caminhos tentados: {caminho_abs} e {caminho_alt}")
+        caminho_abs = caminho_alt
+
+    return _carregar_com_snapshot(caminho_abs, _ler_cultivos_csv, usar_snapshot)
+
+def carregar_eventos(caminho=CAMINHO_EVENTOS_CSV, usar_snapshot=USAR_SNAPSHOTS):
     caminho_abs = os.path.abspath(caminho)
     if not os.path.exists(caminho_abs):
         caminho_alt = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Estações e Festivais.csv")
@@ -37,17 +145,14 @@ def carregar_eventos(caminho=CAMINHO_EVENTOS_CSV):
             raise FileNotFoundError(f"Estações e Festivais.csv não encontrado. Caminhos tentados: {caminho_abs} e {caminho_alt}")
         caminho_abs = caminho_alt
 
-    df = pd.read_csv(caminho_abs, sep=";")
-    for coluna in df.select_dtypes(include="object").columns:
-        df[coluna] = df[coluna].astype(str).str.strip().str.lower().apply(unidecode)
-    df["dia_festival"] = pd.to_numeric(df["dia_festival"], errors="coerce").astype("Int64")
-    return df
+    return _carregar_com_snapshot(caminho_abs, _ler_eventos_csv, usar_snapshot)
 
 def get_preco_semente_map(df_cultivos):
     price_map = {}
-    for _, row in df_cultivos.iterrows():
-        plant = unidecode(str(row['cultivo']).strip().lower())
-        price = row['preco_semente']
+    cultivos = np.asarray(df_cultivos["cultivo"]).tolist()
+    precos = np.asarray(df_cultivos["preco_semente"]).tolist()
+    for cultivo, price in zip(cultivos, precos):
+        plant = unidecode(str(cultivo).strip().lower())
 
         if plant not in price_map or price < price_map[plant]:
             price_map[plant] = price
@@ -62,13 +167,27 @@ def criar_calendario(estacao):
         for dia in range(1, 29)
     ]
 
-def anotar_feriados(calendario, eventos_df):
+def indexar_eventos(eventos_df):
+    indice = {}
+    estacoes = np.asarray(eventos_df["estacao"]).tolist()
+    dias = np.asarray(eventos_df["dia_festival"], dtype=np.float64).tolist()
+    festivais = np.asarray(eventos_df["festival"]).tolist()
+    afeta = np.asarray(eventos_df["afeta_cultivo"]).tolist()
+    obs = np.asarray(eventos_df["obs"]).tolist()
+    for i, (estacao, dia) in enumerate(zip(estacoes, dias)):
+        if math.isnan(dia):
+            continue
+        chave = (estacao, int(dia))
+        if chave not in indice:
+            indice[chave] = {"festival": festivais[i], "afeta_cultivo": afeta[i], "obs": obs[i]}
+    return indice
+
+def anotar_feriados(calendario, eventos_df, indice=None):
+    if indice is None:
+        indice = indexar_eventos(eventos_df)
     for dia in calendario:
-        evento = eventos_df[
-            (eventos_df["estacao"] == dia["estacao"]) & (eventos_df["dia_festival"] == dia["dia"])
-        ]
-        if not evento.empty:
-            info = evento.iloc[0]
+        info = indice.get((dia["estacao"], dia["dia"]))
+        if info is not None:
             dia["feriado"] = True
             dia["festival"] = info["festival"]
             dia["afeta_cultivo"] = info["afeta_cultivo"]
@@ -80,6 +199,41 @@ def anotar_feriados(calendario, eventos_df):
             dia["obs"] = None
     return calendario
 
+_CALENDARIOS_ANOTADOS = {}
+_LOCK_CALENDARIOS = threading.Lock()
+MAX_CALENDARIOS_ANOTADOS = 4
+
+def calendario_anotado(eventos_df):
+    # O ano anotado é compilado uma vez por versão dos eventos e reaproveitado pelos planos seguintes;
+    # "dias" é indexado pelo dia do ano (0 = primavera D1) e não deve ser alterado por quem o consulta.
+    chave = versao_dados(eventos_df)
+    with _LOCK_CALENDARIOS:
+        compilado = _CALENDARIOS_ANOTADOS.get(chave)
+    if compilado is not None:
+        return compilado
+
+    indice = indexar_eventos(eventos_df)
+    dias = []
+    for estacao in ESTACOES_NORMALIZADAS:
+        dias.extend(criar_calendario(estacao))
+    anotar_feriados(dias, eventos_df, indice)
+    ordinais_festivais = [i for i, dia in enumerate(dias) if dia["feriado"]]
+    compilado = {
+        "dias": dias,
+        "eventos": indice,
+        "ordinais_festivais": ordinais_festivais,
+        "festivais": [dias[i] for i in ordinais_festivais],
+    }
+    # Compilado fora do lock; se outra thread chegou antes, fica valendo a versão dela.
+    with _LOCK_CALENDARIOS:
+        if chave in _CALENDARIOS_ANOTADOS:
+            return _CALENDARIOS_ANOTADOS[chave]
+        if len(_CALENDARIOS_ANOTADOS) >= MAX_CALENDARIOS_ANOTADOS:
+            _CALENDARIOS_ANOTADOS.pop(next(iter(_CALENDARIOS_ANOTADOS)))
+        _CALENDARIOS_ANOTADOS[chave] = compilado
+    return compilado
+
+@cronometrar("contagem_dias")
 def transformar_intervalo_em_dias(metricas):
     estacoes_lower = [unidecode(e.lower()) for e in ESTACOES]
     estacao_ini_norm = unidecode(metricas["estacao_ini"].strip().lower())
@@ -100,141 +254,185 @@ def transformar_intervalo_em_dias(metricas):
 
     return dias_na_ini + dias_intermediarios + dias_na_fim
 
+ESTACOES_NORMALIZADAS = [unidecode(e.lower()) for e in ESTACOES]
+BITS_ESTACAO = {estacao: 1 << i for i, estacao in enumerate(ESTACOES_NORMALIZADAS)}
+
+def mascara_estacoes(estacoes):
+    mascara = 0
+    for e in str(estacoes).split(","):
+        mascara |= BITS_ESTACAO.get(unidecode(e.strip().lower()), 0)
+    return mascara
+
 def cresce_na_estacao(estacoes, estacao):
     return estacao in {unidecode(e.strip().lower()) for e in estacoes.split(",")}
 
+def mascaras_cultivos(cultivos_df):
+    if "mascara_estacao" in cultivos_df.columns:
+        return np.asarray(cultivos_df["mascara_estacao"])
+    return np.array([mascara_estacoes(e) for e in np.asarray(cultivos_df["estacao"]).tolist()], dtype=np.uint8)
+
+@cronometrar("filtro_estacao")
 def cultivos_por_estacao(metricas, cultivos_df):
     est_ini = unidecode(metricas["estacao_ini"].strip().lower())
     est_fim = unidecode(metricas["estacao_fim"].strip().lower())
 
+    mascaras = mascaras_cultivos(cultivos_df)
+    cresce_ini = (mascaras & BITS_ESTACAO.get(est_ini, 0)) != 0
+
     if est_ini == est_fim:
-        return cultivos_df.loc[cultivos_df["estacao"].apply(lambda e: cresce_na_estacao(e, est_ini))]
+        return filtrar_linhas(cultivos_df, cresce_ini)
+
+    cresce_fim = (mascaras & BITS_ESTACAO.get(est_fim, 0)) != 0
+    ambas = cresce_ini & cresce_fim
+    if ambas.any():
+        return filtrar_linhas(cultivos_df, ambas)
 
-    df = cultivos_df.loc[cultivos_df["estacao"].apply(
-        lambda e: cresce_na_estacao(e, est_ini) and cresce_na_estacao(e, est_fim)
-    )]
-    if not df.empty:
-        return df
+    return filtrar_linhas(cultivos_df, cresce_ini | cresce_fim)
 
-    return cultivos_df.loc[cultivos_df["estacao"].apply(
-        lambda e: cresce_na_estacao(e, est_ini) or cresce_na_estacao(e, est_fim)
-    )]
 
+def _ausente(valor):
+    if valor is None:
+        return True
+    try:
+        return math.isnan(valor)
+    except TypeError:
+        return False
 
 def calcular_colheitas(dias_totais, dias_cresc, intervalo, planta_nome):
-    if dias_cresc is None or pd.isna(dias_cresc) or dias_cresc == 0:
+    if _ausente(dias_cresc) or dias_cresc == 0:
         return 0
     dias_cresc = int(dias_cresc)
     if dias_totais < dias_cresc:
         return 0
 
-    colheitas = 0
-    planta_nome = unidecode(planta_nome.lower())
-
-    if intervalo is None or pd.isna(intervalo) or intervalo == 0:
-
-        dia_plantio = 1
-        dias_ciclo = dias_cresc
-
-        while True:
-            dia_colheita = dia_plantio + dias_cresc - 1
-
-            if dia_colheita <= dias_totais:
-                colheitas += 1
-                dia_plantio += dias_ciclo
-            else:
-                break
-
-        if dias_totais == 28:
-            if dias_cresc == 4 and colheitas == 7:
-                return 6
-            if dias_cresc == 7 and colheitas == 4:
-                return 3
-
-        elif dias_totais == 56:
-            if planta_nome == "girassol" and colheitas == 7:
-                 return 6
-
-        return colheitas
+    multipla = not (_ausente(intervalo) or intervalo == 0)
 
+    if multipla:
+        # Primeira colheita no dia dias_cresc, depois uma a cada intervalo.
+        colheitas = 1 + (dias_totais - dias_cresc) // int(intervalo)
     else:
-        intervalo = int(intervalo)
-
-        dia_colheita = dias_cresc
-
-        if dia_colheita <= dias_totais:
-            colheitas += 1
-
-            while True:
-                dia_colheita += intervalo
-                if dia_colheita <= dias_totais:
-                    colheitas += 1
-                else:
-                    break
+        # Replantio no dia seguinte a cada colheita.
+        colheitas = dias_totais // dias_cresc
 
-        if dias_totais == 28:
-            if (planta_nome == "vagem" and colheitas == 7) or \
-               (planta_nome == "grao de cafe" and colheitas == 10):
-                return colheitas - 1
-            if planta_nome == "morango" and colheitas == 6:
-                return 5
-            if planta_nome == "lupulo" and colheitas == 18:
-                 return 17
-            if planta_nome == "amaranto" and colheitas == 4:
-                 return 3
-            if planta_nome == "brocolis" and colheitas == 6:
-                 return 5
+    return ajustar_colheitas(colheitas, dias_totais, dias_cresc, multipla, planta_nome)
 
-        elif dias_totais == 56:
-            if planta_nome == "grao de cafe" and colheitas == 24:
-                 return 23
 
-        return colheitas
+def ajustar_colheitas(colheitas, dias_totais, dias_cresc, multipla, planta_nome):
+    ajuste = AJUSTES_COLHEITAS_POR_CICLO.get((multipla, dias_totais, dias_cresc, colheitas))
+    if ajuste is not None:
+        return ajuste
 
+    planta_nome = unidecode(planta_nome.lower())
+    return AJUSTES_COLHEITAS_POR_CULTIVO.get((multipla, dias_totais, planta_nome, colheitas), colheitas)
+
+
+MULTIPLICADORES_COLHEITA = {"grao de cafe": 4, "mirtilo": 3, "oxicoco": 2}
+
+DTYPE_RANKING = np.dtype([
+    ("planta", object),
+    ("estacoes", object),
+    ("colheitas_possiveis", np.int64),
+    ("lucro_unit", np.float64),
+    ("lucro_total", np.float64),
+])
+
+
+def multiplicadores_colheita(nomes):
+    nomes = np.asarray(nomes, dtype=object)
+    multiplicador = np.ones(len(nomes), dtype=np.float64)
+    for nome, qtd in MULTIPLICADORES_COLHEITA.items():
+        multiplicador[nomes == nome] = qtd
+    return multiplicador
+
+def dias_uteis_por_cultivo(nomes, dias_totais, estacao_ini, dia_ini, estacao_fim, dia_fim):
+    # Dias de cultivo de cada planta no intervalo: o morango só conta a partir do dia mínimo de plantio.
+    # dias_totais, dia_ini e dia_fim podem ser vetores (um intervalo por linha, mesmas estações).
+    nomes = np.asarray(nomes, dtype=object)
+    dias_totais = np.asarray(dias_totais, dtype=np.int64)
+    dias_util = np.repeat(dias_totais[..., None], len(nomes), axis=-1)
+
+    estacao_ini = estacao_ini.lower()
+    if estacao_ini == "primavera":
+        dia_ini = np.asarray(dia_ini, dtype=np.int64)
+        if estacao_ini == estacao_fim.lower():
+            dias_morango = np.maximum(0, np.asarray(dia_fim, dtype=np.int64) - DIA_PLANTIO_MINIMO_MORANGO + 1)
+        else:
+            dias_morango = np.maximum(0, dias_totais - (DIA_PLANTIO_MINIMO_MORANGO - dia_ini))
+        restrito = np.broadcast_to(dia_ini < DIA_PLANTIO_MINIMO_MORANGO, dias_totais.shape)
+        morango = nomes == "morango"
+        dias_util[..., morango] = np.where(restrito, np.broadcast_to(dias_morango, dias_totais.shape),
+                                           dias_totais)[..., None]
+    return dias_util
 
 def lucro_esperado(planta, colheitas, preco_venda):
-    multiplos = {"grao de cafe": 4, "mirtilo": 3, "oxicoco": 2}
     planta_norm = unidecode(planta.strip().lower())
-    qtd = multiplos.get(planta_norm, 1)
+    qtd = MULTIPLICADORES_COLHEITA.get(planta_norm, 1)
     return preco_venda * colheitas * qtd
 
-def listar_plantas_possiveis(metricas, cultivos_df):
-    dias_totais = transformar_intervalo_em_dias(metricas)
+@cronometrar("colheitas")
+def calcular_colheitas_vetorizado(dias_totais, dias_cresc, intervalo, plantas):
+    dias_totais = np.asarray(dias_totais, dtype=np.int64)
+    dias_cresc = np.asarray(dias_cresc, dtype=np.float64)
+    intervalo = np.asarray(intervalo, dtype=np.float64)
+    plantas = np.asarray(plantas, dtype=object)
+
+    validos = ~np.isnan(dias_cresc) & (dias_cresc != 0)
+    multipla = ~np.isnan(intervalo) & (intervalo != 0)
+    dc = np.where(validos, dias_cresc, 1).astype(np.int64)
+    passo = np.where(multipla, intervalo, 1).astype(np.int64)
+
+    colheitas = np.where(multipla, 1 + (dias_totais - dc) // passo, dias_totais // dc)
+    colheitas = np.where(validos & (dias_totais >= dc), colheitas, 0)
+
+    ajustadas = colheitas.copy()
+    pendentes = colheitas > 0
+    for (mult, dias, ciclo, calculadas), reais in AJUSTES_COLHEITAS_POR_CICLO.items():
+        alvo = pendentes & (multipla == mult) & (dias_totais == dias) & (dc == ciclo) & (colheitas == calculadas)
+        ajustadas[alvo] = reais
+        pendentes &= ~alvo
+    for (mult, dias, nome, calculadas), reais in AJUSTES_COLHEITAS_POR_CULTIVO.items():
+        alvo = pendentes & (multipla == mult) & (dias_totais == dias) & (plantas == nome) & (colheitas == calculadas)
+        ajustadas[alvo] = reais
+    return ajustadas
+
+def colunas_avaliacao(plantas):
+    return {
+        "cultivo": np.asarray(plantas["cultivo"], dtype=object),
+        "estacao": np.asarray(plantas["estacao"], dtype=object),
+        "dias_cresc": np.asarray(plantas["dias_cresc"], dtype=np.float64),
+        "intervalo_colheita": np.asarray(plantas["intervalo_colheita"], dtype=np.float64),
+        "preco_venda": np.asarray(plantas["preco_venda"], dtype=np.float64),
+    }
+
+def avaliar_plantas_vetorizado(metricas, cultivos_df):
     plantas = cultivos_por_estacao(metricas, cultivos_df)
-    resultado = []
-
-    for _, row in plantas.iterrows():
-        dias_cresc = row["dias_cresc"]
-        intervalo_colheita = row["intervalo_colheita"]
-
-        dias_util = dias_totais
-
-        if row["cultivo"] == "morango" and metricas["estacao_ini"].lower() == "primavera":
+    return avaliar_colunas(metricas, colunas_avaliacao(plantas))
 
-            DIA_PLANTIO_MINIMO = 14
-
-            if metricas["dia_ini"] < DIA_PLANTIO_MINIMO:
+def avaliar_colunas(metricas, colunas):
+    dias_totais = transformar_intervalo_em_dias(metricas)
+    nomes = colunas["cultivo"]
+    dias_util = dias_uteis_por_cultivo(nomes, dias_totais, metricas["estacao_ini"], metricas["dia_ini"],
+                                       metricas["estacao_fim"], metricas["dia_fim"])
 
-                if metricas["estacao_ini"].lower() == metricas["estacao_fim"].lower():
-                    dias_util = max(0, metricas["dia_fim"] - DIA_PLANTIO_MINIMO + 1)
+    colheitas = calcular_colheitas_vetorizado(
+        dias_util, colunas["dias_cresc"], colunas["intervalo_colheita"], nomes
+    )
 
-                else:
-                    dias_perdidos = DIA_PLANTIO_MINIMO - metricas["dia_ini"]
-                    dias_util = max(0, dias_totais - dias_perdidos)
+    lucro_unit = colunas["preco_venda"] * multiplicadores_colheita(nomes)
 
-                if dias_util == 0:
-                    continue
+    possiveis = colheitas > 0
+    ranking = np.empty(int(possiveis.sum()), dtype=DTYPE_RANKING)
+    ranking["planta"] = nomes[possiveis]
+    ranking["estacoes"] = colunas["estacao"][possiveis]
+    ranking["colheitas_possiveis"] = colheitas[possiveis]
+    ranking["lucro_unit"] = lucro_unit[possiveis]
+    ranking["lucro_total"] = lucro_unit[possiveis] * colheitas[possiveis]
 
-        colheitas = calcular_colheitas(dias_util, dias_cresc, intervalo_colheita, row["cultivo"])
+    ordem = np.argsort(-ranking["lucro_total"], kind="stable")
+    return ranking[ordem]
 
-        if colheitas > 0:
-            resultado.append({
-                "planta": row["cultivo"],
-                "estacoes": row["estacao"],
-                "colheitas_possiveis": colheitas,
-                "lucro_unit": lucro_esperado(row["cultivo"], 1, row["preco_venda"]),
-                "lucro_total": lucro_esperado(row["cultivo"], colheitas, row["preco_venda"])
-            })
+def ranking_para_lista(ranking):
+    return [dict(zip(ranking.dtype.names, linha)) for linha in ranking.tolist()]
 
-    resultado.sort(key=lambda x: x["lucro_total"], reverse=True)
-    return resultado
\ No newline at end of file
+def listar_plantas_possiveis(metricas, cultivos_df):
+    return ranking_para_lista(avaliar_plantas_vetorizado(metricas, cultivos_df))
@@ -0,0 +1,103 @@
+import os
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from config import TAMANHO_BLOCO_LOTE
+from tratamento_dados import gerar_plano
+from tratamento_menssagem import renderizar_texto_plano
+from plano import plano_para_dict
+
+MODOS_LOTE = ("processos", "threads", "serial")
+RENDERIZADORES = {
+    "texto": renderizar_texto_plano,
+    "json": plano_para_dict,
+    "objeto": lambda plano: plano,
+}
+
+# Catálogo, eventos, mapa de preços e tabela de respostas de cada processo trabalhador.
+_CONTEXTO_TRABALHADOR = {}
+
+
+def _inicializar_trabalhador(df_cultivos, df_eventos, preco_semente_map, tabela_respostas):
+    _CONTEXTO_TRABALHADOR["contexto"] = (df_cultivos, df_eventos, preco_semente_map, tabela_respostas)
+
+
+def _em_blocos(iteravel, tamanho):
+    iterador = iter(iteravel)
+    while True:
+        bloco = list(islice(iterador, tamanho))
+        if not bloco:
+            return
+        yield bloco
+
+
+def _processar_bloco(bloco, contexto, formato="texto"):
+    df_cultivos, df_eventos, preco_semente_map, tabela_respostas = contexto
+    renderizar = RENDERIZADORES[formato]
+    resultados = []
+    for indice, dados_entrada in bloco:
+        try:
+            plano = renderizar(gerar_plano(dados_entrada, df_cultivos, df_eventos, preco_semente_map, tabela_respostas))
+            erro = None
+        except Exception as e:
+            plano = None
+            erro = f"{type(e).__name__}: {e}"
+        resultados.append({"indice": indice, "dados_entrada": dados_entrada, "plano": plano, "erro": erro})
+    return resultados
+
+
+def _processar_bloco_no_trabalhador(bloco, formato):
+    return _processar_bloco(bloco, _CONTEXTO_TRABALHADOR["contexto"], formato)
+
+
+def processar_lote(requisicoes, df_cultivos, df_eventos, preco_semente_map, tabela_respostas=None,
+                   modo="processos", max_trabalhadores=None, ordenado=True, tamanho_bloco=TAMANHO_BLOCO_LOTE,
+                   formato="texto"):
+    if modo not in MODOS_LOTE:
+        raise ValueError(f"Modo de lote inválido: '{modo}'. Use um de {MODOS_LOTE}.")
+    if formato not in RENDERIZADORES:
+        raise ValueError(f"Formato de plano inválido: '{formato}'. Use um de {tuple(RENDERIZADORES)}.")
+
+    contexto = (df_cultivos, df_eventos, preco_semente_map, tabela_respostas)
+    blocos = _em_blocos(enumerate(requisicoes), tamanho_bloco)
+
+    if modo == "serial" or max_trabalhadores == 1:
+        for bloco in blocos:
+            yield from _processar_bloco(bloco, contexto, formato)
+        return
+
+    max_trabalhadores = max_trabalhadores or os.cpu_count() or 1
+    if modo == "processos":
+        executor = ProcessPoolExecutor(max_workers=max_trabalhadores,
+                                       initializer=_inicializar_trabalhador, initargs=contexto)
+        enviar = lambda bloco: executor.submit(_processar_bloco_no_trabalhador, bloco, formato)
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_trabalhadores)
+        enviar = lambda bloco: executor.submit(_processar_bloco, bloco, contexto, formato)
+
+    # Limita os blocos em andamento para manter a memória estável com entradas muito grandes.
+    max_pendentes = 2 * max_trabalhadores
+    pendentes = {}
+    concluidos = {}
+    proximo_bloco = 0
+
+    def coletar(futuros):
+        nonlocal proximo_bloco
+        for futuro in futuros:
+            numero = pendentes.pop(futuro)
+            if not ordenado:
+                yield from futuro.result()
+                continue
+            concluidos[numero] = futuro.result()
+        while proximo_bloco in concluidos:
+            yield from concluidos.pop(proximo_bloco)
+            proximo_bloco += 1
+
+    with executor:
+        for numero, bloco in enumerate(blocos):
+            pendentes[enviar(bloco)] = numero
+            while len(pendentes) + len(concluidos) >= max_pendentes:
+                feitos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+                yield from coletar(feitos)
+        while pendentes:
+            feitos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            yield from coletar(feitos)
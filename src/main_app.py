@@ -1,5 +1,8 @@
 import os
 import sys
+import time
+
+INICIO_IMPORTACAO = time.perf_counter()
 
 if getattr(sys, 'frozen', False):
     SCRIPT_DIR = os.path.dirname(os.path.abspath(sys.executable))
@@ -13,38 +16,28 @@ if SCRIPT_DIR not in sys.path:
 import platform
 import tkinter as tk
 from tkinter import ttk, font as tkFont, filedialog
-from PIL import Image, ImageTk, ImageDraw, ImageFont, ImageEnhance
+from PIL import ImageTk, ImageDraw, ImageFont
 import random
-import time
 import traceback
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
-try:
-    import pygame
-except ImportError:
-    print("⚠️ Biblioteca Pygame não encontrada. Instale com 'pip install pygame'")
-    pygame = None
-
-try:
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.units import inch
-    from reportlab.lib.colors import HexColor
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-    print("⚠️ Biblioteca ReportLab não encontrada. A exportação de PDF será desativada.")
+# pygame e reportlab são importados sob demanda (áudio habilitado / primeira exportação de PDF).
+pygame = None
 
 from config import *
 from utils import (
     _hex_to_rgb, _rgb_to_hex, _interpolate_color, animate_hover_color,
-    arredondar_cantos, criar_imagem_gradiente, animate_hover_bg
+    criar_imagem_gradiente, animate_hover_bg
 )
+from cache_imagens import fundo_splash, fundo_principal, icones_fruta
 from calendario import abrir_calendario_popup, TKCALENDAR_AVAILABLE
-from tratamento_dados import tratar_e_processar_dados
+from tratamento_dados import gerar_plano
+from tratamento_menssagem import renderizar_texto_plano
+from exportar_pdf import exportar_plano_pdf
+from instrumentacao import REGISTRO, medir
 from logica import carregar_cultivos, carregar_eventos, get_preco_semente_map
+from tabela_respostas import obter_tabela_respostas
 
 
 def _carregar_lista_personagens(caminho):
@@ -87,9 +80,14 @@ def carregar_fonte_sistema(caminho):
 
 def inicializar_audio():
     global EFEITO_SOM_HOVER, pygame
-    if not pygame:
-        print("❌ Pygame não está disponível. Áudio desativado.")
-        return False
+    if pygame is None:
+        try:
+            import pygame as modulo_pygame
+        except ImportError:
+            print("⚠️ Biblioteca Pygame não encontrada. Instale com 'pip install pygame'")
+            print("❌ Pygame não está disponível. Áudio desativado.")
+            return False
+        pygame = modulo_pygame
     try:
         pygame.mixer.init()
         print("✅ Pygame Mixer inicializado.")
@@ -135,16 +133,11 @@ def adicionar_som_hover(widget):
         widget.bind("<Enter>", tocar_efeito_hover, add=True)
 
 
-if REPORTLAB_AVAILABLE:
-    try:
-        if os.path.exists(FONTE_ARQUIVO):
-            pdfmetrics.registerFont(TTFont(FONT_NAME_PDF, FONTE_ARQUIVO))
-            print(f"✅ Fonte '{FONT_NAME_PDF}' registrada com sucesso no ReportLab.")
-        else:
-            raise FileNotFoundError("Arquivo da fonte não encontrado.")
-    except Exception as e:
-        print(f"⚠️ Aviso: Não foi possível registrar a fonte '{FONT_NAME_PDF}' para o PDF. Usando 'Helvetica'. Erro: {e}")
-        FONT_NAME_PDF = 'Helvetica'
+def relatorio_primeiro_quadro():
+    tempo_ms = (time.perf_counter() - INICIO_IMPORTACAO) * 1000
+    carregados = [m for m in MODULOS_PESADOS if m in sys.modules]
+    print(f"⏱️ Primeiro quadro em {tempo_ms:.0f} ms desde o início das importações.")
+    print(f"⏱️ Módulos pesados já carregados: {', '.join(carregados) if carregados else 'nenhum'}")
 
 
 class SplashScreen(tk.Frame):
@@ -158,7 +151,7 @@ class SplashScreen(tk.Frame):
         self._y = 0
 
         try:
-            imagem_pil = arredondar_cantos(Image.open(IMAGEM_FUNDO_SPLASH).convert("RGBA"), 24)
+            imagem_pil = fundo_splash()
             self.imagem_tk = ImageTk.PhotoImage(imagem_pil)
             self.width = self.imagem_tk.width()
             self.height = self.imagem_tk.height()
@@ -254,12 +247,23 @@ class SplashScreen(tk.Frame):
 
 
 class FarmApp(tk.Frame):
-    def __init__(self, master, df_cultivos, df_eventos, preco_semente_map, **kwargs):
+    def __init__(self, master, df_cultivos, df_eventos, preco_semente_map, tabela_respostas=None, **kwargs):
 
         self.master = master
         self.df_cultivos_cache = df_cultivos
         self.df_eventos_cache = df_eventos
         self.preco_semente_map = preco_semente_map
+        self.tabela_respostas = tabela_respostas
+        self.plano_atual = None
+
+        # Cálculos pesados rodam fora da thread do Tk; os resultados voltam pela fila, consultada com after().
+        self.executor_tarefas = ThreadPoolExecutor(max_workers=2, thread_name_prefix="farmapp")
+        self.fila_ui = queue.Queue()
+        self.tarefas_ativas = 0
+        self.consulta_fila_id = None
+        self.geracao_plano = 0
+        self.futuro_plano = None
+        self.futuro_pdf = None
 
         if 'bg' not in kwargs:
             kwargs['bg'] = COR_TRANSPARENTE
@@ -285,22 +289,13 @@ class FarmApp(tk.Frame):
             self.option_add("*Text.cursor", TEXT_IBEAM_CURSOR)
 
         try:
-            imagem_pil_original = Image.open(IMAGEM_FUNDO_MAIN).convert("RGBA")
-
-            try:
-                if LISTA_IMAGENS_PERSONAGENS:
-                    imagem_escolhida = random.choice(LISTA_IMAGENS_PERSONAGENS)
-                    imagem_personagem_pil = Image.open(imagem_escolhida).convert("RGBA")
-                    imagem_personagem_pil = imagem_personagem_pil.resize((125, 125), Image.Resampling.LANCZOS)
-                    imagem_pil_original.paste(imagem_personagem_pil, (8, 455), imagem_personagem_pil)
-                else:
-                    print("⚠️ Nenhuma imagem encontrada em 'images personagens'.")
-
-            except Exception as e:
-                print(f"⚠️ Erro ao carregar personagem: {e}")
+            imagem_escolhida = None
+            if LISTA_IMAGENS_PERSONAGENS:
+                imagem_escolhida = random.choice(LISTA_IMAGENS_PERSONAGENS)
+            else:
+                print("⚠️ Nenhuma imagem encontrada em 'images personagens'.")
 
-            imagem_pil_arredondada = arredondar_cantos(imagem_pil_original, 24)
-            self.imagem_base_pil = imagem_pil_arredondada.copy()
+            self.imagem_base_pil = fundo_principal(imagem_escolhida)
             self.imagem_tk = ImageTk.PhotoImage(self.imagem_base_pil)
 
             self.width = self.imagem_tk.width()
@@ -318,10 +313,7 @@ class FarmApp(tk.Frame):
 
         self.icone_disponivel = False
         try:
-            icone_fruta_pil = Image.open(ICONE_FRUTA).convert("RGBA")
-            icone_fruta_pil = icone_fruta_pil.resize((32, 32), Image.Resampling.LANCZOS)
-            enhancer = ImageEnhance.Brightness(icone_fruta_pil)
-            icone_fruta_pressed_pil = enhancer.enhance(0.7)
+            icone_fruta_pil, icone_fruta_pressed_pil = icones_fruta()
             self.icone_fruta_tk = ImageTk.PhotoImage(icone_fruta_pil)
             self.icone_fruta_pressed_tk = ImageTk.PhotoImage(icone_fruta_pressed_pil)
             self.icone_disponivel = True
@@ -380,6 +372,7 @@ class FarmApp(tk.Frame):
         self.scrollbar.config(command=self.texto_plano.yview)
         frame_plano.place(x=378, y=85, width=400, height=450)
         self.texto_plano.config(state="disabled")
+        self.cursor_texto_plano = self.texto_plano.cget("cursor")
 
         self.vcmd = (self.register(self.validate_input), '%P')
 
@@ -456,12 +449,73 @@ class FarmApp(tk.Frame):
         self.background_label.bind("<B1-Motion>", self.mover_janela)
         self.background_label.bind("<Motion>", self.gerenciar_cursor)
 
+        # Painel de diagnóstico escondido: Ctrl+Shift+D.
+        self.painel_diagnostico = None
+        self.master.bind("<Control-Shift-D>", self.alternar_painel_diagnostico)
+
+        if USAR_TABELA_RESPOSTAS and self.tabela_respostas is None:
+            self.preparar_tabela_respostas()
+
         tocar_musica(MUSICA_TEMA_SISTEMA, volume=0.1)
 
     def fechar_janela(self, event=None):
         parar_musica()
+        if REGISTRO.habilitado and REGISTRO.resumo():
+            REGISTRO.despejar()
+        self.executor_tarefas.shutdown(wait=False, cancel_futures=True)
         self.master.destroy()
 
+    def preparar_tabela_respostas(self):
+        # Até a tabela ficar pronta, os planos usam listar_plantas_possiveis (tabela_respostas=None).
+        def ao_concluir(tabela, erro):
+            if erro is not None:
+                print(f"⚠️ Tabela de respostas indisponível, calculando sob demanda. {erro}")
+                return
+            self.tabela_respostas = tabela
+
+        self.executar_em_segundo_plano(lambda: obter_tabela_respostas(self.df_cultivos_cache), ao_concluir)
+
+    def executar_em_segundo_plano(self, tarefa, ao_concluir):
+        def executar():
+            try:
+                resultado, erro = tarefa(), None
+            except Exception as e:
+                traceback.print_exc()
+                resultado, erro = None, e
+            self.fila_ui.put((self._concluir_tarefa, (ao_concluir, resultado, erro)))
+
+        self.tarefas_ativas += 1
+        futuro = self.executor_tarefas.submit(executar)
+        if self.consulta_fila_id is None:
+            self.consulta_fila_id = self.after(INTERVALO_FILA_UI_MS, self._consultar_fila_ui)
+        return futuro
+
+    def cancelar_tarefa(self, futuro):
+        if futuro is not None and futuro.cancel():
+            self.tarefas_ativas -= 1
+
+    def publicar_na_ui(self, funcao, *args):
+        self.fila_ui.put((funcao, args))
+
+    def _concluir_tarefa(self, ao_concluir, resultado, erro):
+        self.tarefas_ativas -= 1
+        ao_concluir(resultado, erro)
+
+    def _consultar_fila_ui(self):
+        self.consulta_fila_id = None
+        while True:
+            try:
+                funcao, args = self.fila_ui.get_nowait()
+            except queue.Empty:
+                break
+            funcao(*args)
+        if self.tarefas_ativas > 0 and self.winfo_exists():
+            self.consulta_fila_id = self.after(INTERVALO_FILA_UI_MS, self._consultar_fila_ui)
+
+    def definir_ocupado(self, ocupado):
+        self.botao_GerarPlano.config(text="Gerando..." if ocupado else "Gerar Plano")
+        self.texto_plano.config(cursor="watch" if ocupado else self.cursor_texto_plano)
+
     def iniciar_movimento(self, event):
         self._x = event.x
         self._y = event.y
@@ -562,6 +616,11 @@ class FarmApp(tk.Frame):
             self.texto_plano.config(state="normal")
             self.texto_plano.delete(1.0, "end")
             self.texto_plano.config(state="disabled")
+            self.plano_atual = None
+            self.geracao_plano += 1
+            self.cancelar_tarefa(self.futuro_plano)
+            self.futuro_plano = None
+            self.definir_ocupado(False)
 
             self.scrollbar.pack_forget()
             self.texto_plano.pack_forget()
@@ -611,20 +670,45 @@ class FarmApp(tk.Frame):
             return
 
         dados_entrada = self.criar_dados_entrada(opcao, quantidade_valor, data)
-        texto_final = ""
 
-        try:
-            texto_final = tratar_e_processar_dados(
+        # Um novo clique substitui o cálculo anterior: se ainda não começou é cancelado, senão o resultado é descartado.
+        self.geracao_plano += 1
+        geracao = self.geracao_plano
+        self.cancelar_tarefa(self.futuro_plano)
+        self.plano_atual = None
+        self.definir_ocupado(True)
+
+        def calcular():
+            plano = gerar_plano(
                 dados_entrada,
                 self.df_cultivos_cache,
                 self.df_eventos_cache,
-                self.preco_semente_map
+                self.preco_semente_map,
+                self.tabela_respostas
             )
-        except Exception as e:
+            return plano, renderizar_texto_plano(plano)
+
+        def ao_concluir(resultado, erro):
+            if geracao != self.geracao_plano:
+                return
+            self.futuro_plano = None
+            self.definir_ocupado(False)
+            self.exibir_plano(dados_entrada, resultado, erro)
+
+        self.futuro_plano = self.executar_em_segundo_plano(calcular, ao_concluir)
+
+    def exibir_plano(self, dados_entrada, resultado, erro):
+        opcao = dados_entrada["opcao_estrategia"]
+        quantidade = dados_entrada["quantidade"]
+        data = dados_entrada["data_inicio"]
+
+        if erro is None:
+            self.plano_atual, texto_final = resultado
+        else:
             print("--- ERRO NO PROCESSAMENTO DE DADOS/NARRATIVA ---")
-            traceback.print_exc()
+            print(f"{type(erro).__name__}: {erro}")
             print("-------------------------------------------------")
-            self.mostrar_popup_customizado(self.master, "Erro de Processamento", f"Ocorreu um erro interno na lógica: {e}. Verifique o terminal para detalhes.", tipo='erro')
+            self.mostrar_popup_customizado(self.master, "Erro de Processamento", f"Ocorreu um erro interno na lógica: {erro}. Verifique o terminal para detalhes.", tipo='erro')
             texto_final = f"📋 Plano de Colheita\nOpção: {opcao}\nQuantidade: {quantidade}\nData: {data}\n\n[ERRO: Falha ao processar dados.]"
 
         if not isinstance(texto_final, str):
@@ -636,10 +720,11 @@ class FarmApp(tk.Frame):
             self.background_label.config(image=img_limpa_tk)
             self.background_label.image = img_limpa_tk
 
-            self.texto_plano.config(state="normal")
-            self.texto_plano.delete(1.0, "end")
-            self.texto_plano.insert("end", texto_final)
-            self.update_idletasks()
+            with medir("insercao_ui"):
+                self.texto_plano.config(state="normal")
+                self.texto_plano.delete(1.0, "end")
+                self.texto_plano.insert("end", texto_final)
+                self.update_idletasks()
 
             top, bottom = self.texto_plano.yview()
             if bottom < 1.0:
@@ -654,6 +739,64 @@ class FarmApp(tk.Frame):
         except Exception as e:
             self.mostrar_popup_customizado(self.master, "Erro de UI", f"Não foi possível exibir o plano: {e}", tipo='erro')
 
+    def alternar_painel_diagnostico(self, event=None):
+        if self.painel_diagnostico is not None and self.painel_diagnostico.winfo_exists():
+            self.painel_diagnostico.destroy()
+            self.painel_diagnostico = None
+            return
+
+        painel = tk.Toplevel(self.master)
+        self.painel_diagnostico = painel
+        painel.title("Diagnóstico")
+        painel.attributes('-topmost', True)
+        painel.config(bg=COR_CAL_FUNDO_POPUP, highlightbackground=COR_CAL_BORDA_POPUP, highlightthickness=3)
+
+        texto = tk.Text(painel, width=62, height=18, font=("Courier", 10), bg=COR_CAL_DIA_BG, fg=COR_CAL_DIA_FG,
+                        relief="flat", padx=8, pady=8)
+        texto.pack(fill="both", expand=True, padx=6, pady=(6, 0))
+        barra = tk.Frame(painel, bg=COR_CAL_FUNDO_POPUP)
+        barra.pack(fill="x", padx=6, pady=6)
+
+        def escrever(conteudo):
+            texto.config(state="normal")
+            texto.delete(1.0, "end")
+            texto.insert("end", conteudo)
+            texto.config(state="disabled")
+
+        def atualizar():
+            if not painel.winfo_exists():
+                return
+            estado = "ligada" if REGISTRO.habilitado else "desligada (FARM_INSTRUMENTACAO=1 ou botão Ligar)"
+            escrever(f"Instrumentação {estado}\n\n{REGISTRO.texto_resumo()}")
+            painel.after(1000, atualizar)
+
+        def alternar():
+            REGISTRO.habilitado = not REGISTRO.habilitado
+            botao_ligar.config(text="Desligar" if REGISTRO.habilitado else "Ligar")
+
+        def memoria():
+            foto = REGISTRO.snapshot_memoria()
+            linhas = [f"Memória rastreada: {foto['atual_kb']:.0f} KB (pico {foto['pico_kb']:.0f} KB)", ""]
+            linhas += [f"{m['tamanho_kb']:9.1f} KB  {m['blocos']:6} blocos  {m['local']}" for m in foto["maiores"]]
+            escrever("\n".join(linhas))
+
+        def salvar():
+            caminho = REGISTRO.despejar()
+            if caminho:
+                escrever(f"Resumo gravado em:\n{caminho}\n\n{REGISTRO.texto_resumo()}")
+
+        botoes = [("Ligar" if not REGISTRO.habilitado else "Desligar", alternar), ("Memória", memoria),
+                  ("Salvar log", salvar), ("Limpar", REGISTRO.limpar)]
+        for rotulo, comando in botoes:
+            botao = tk.Button(barra, text=rotulo, command=comando, bg=COR_CAL_CABECALHO_BG, fg=COR_CAL_CABECALHO_FG,
+                              activebackground="#f3a166", activeforeground=COR_CAL_CABECALHO_FG, relief="flat",
+                              font=(FONTE_APP, 10, "bold"), cursor=POINTER_CURSOR)
+            botao.pack(side="left", padx=(0, 6))
+            if comando is alternar:
+                botao_ligar = botao
+        painel.protocol("WM_DELETE_WINDOW", self.alternar_painel_diagnostico)
+        atualizar()
+
     def mostrar_ajuda_popup(self):
         if hasattr(self, 'ajuda_popup') and self.ajuda_popup.winfo_exists():
             self.ajuda_popup.destroy()
@@ -727,29 +870,12 @@ Olá! Seja bem-vindo(a) ao
         popup.focus_set()
         janela_pai.wait_window(popup)
 
-    def _add_footer_pdf(self, canvas, doc):
-        canvas.saveState()
-        try:
-            canvas.setFont(FONT_NAME_PDF, 9)
-        except:
-            canvas.setFont('Helvetica', 9)
-        page_text = f"Página {canvas.getPageNumber()}"
-        canvas.drawRightString(doc.width + doc.leftMargin - (0.5*inch),
-                               doc.bottomMargin / 2, page_text)
-        canvas.restoreState()
-
     def salvar_como_pdf(self):
-        if not REPORTLAB_AVAILABLE:
-            self.mostrar_popup_customizado(self.master, "Erro de Dependência",
-                                      "A biblioteca 'reportlab' é necessária para exportar PDF.\n\n"
-                                      "Feche o app, instale-a com:\n"
-                                      "py -m pip install reportlab\n\n"
-                                      "E tente novamente.",
-                                      tipo='erro')
+        if self.futuro_pdf is not None:
+            self.mostrar_popup_customizado(self.master, "Aviso", "Já existe uma exportação de PDF em andamento.", tipo='aviso')
             return
 
-        plano_texto = self.texto_plano.get(1.0, "end").strip()
-        if not plano_texto:
+        if self.plano_atual is None:
             self.mostrar_popup_customizado(self.master, "Aviso", "Não há plano gerado para salvar.", tipo='aviso')
             return
 
@@ -762,47 +888,42 @@ Olá! Seja bem-vindo(a) ao
         if not filepath:
             return
 
-        try:
-            doc = SimpleDocTemplate(filepath, pagesize=A4,
-                                    rightMargin=0.75*inch, leftMargin=0.75*inch,
-                                    topMargin=0.75*inch, bottomMargin=0.75*inch)
-            story = []
-
-            style_title = ParagraphStyle(name='TitleStyle', fontName=FONT_NAME_PDF, fontSize=20,
-                                         textColor=HexColor(COR_PDF_TITULO), alignment=1, spaceAfter=12)
-            style_heading = ParagraphStyle(name='HeadingStyle', fontName=FONT_NAME_PDF, fontSize=14,
-                                           textColor=HexColor(COR_PDF_SUBTITULO), spaceBefore=10, spaceAfter=6, alignment=0)
-            style_body = ParagraphStyle(name='BodyStyle', fontName=FONT_NAME_PDF, fontSize=10,
-                                        textColor=HexColor(COR_PDF_TEXTO), leading=14, alignment=0)
-            style_body_indent = ParagraphStyle(name='BodyIndentStyle', parent=style_body,
-                                               leftIndent=0.25 * inch, firstLineIndent=0)
-
-            story.append(Paragraph("Plano de Colheita", style_title))
-            linhas = plano_texto.split('\n')
-            for linha in linhas:
-                linha_strip = linha.strip()
-                if not linha_strip:
-                    story.append(Spacer(1, 0.1 * inch))
-                    continue
-                if linha_strip.startswith('---'):
-                    texto_limpo = linha_strip.replace('---', '').strip()
-                    story.append(Paragraph(texto_limpo, style_heading))
-                elif (linha_strip.startswith('▪️') or linha_strip.startswith('>') or
-                      linha_strip.startswith('(') or linha_strip.startswith('✅') or
-                      linha_strip.startswith('[AVISO:')):
-                    story.append(Paragraph(linha, style_body_indent))
-                else:
-                    story.append(Paragraph(linha, style_body))
-            doc.build(story, onFirstPage=self._add_footer_pdf, onLaterPages=self._add_footer_pdf)
+        plano = self.plano_atual
+
+        def ao_progredir(fracao, paginas):
+            self.publicar_na_ui(self.mostrar_progresso_pdf, fracao)
+
+        def ao_concluir(resultado, erro):
+            self.futuro_pdf = None
+            self.botao_Download.config(text="Download")
+            self.concluir_pdf(filepath, erro)
+
+        self.mostrar_progresso_pdf(0.0)
+        self.futuro_pdf = self.executar_em_segundo_plano(
+            lambda: exportar_plano_pdf(plano, filepath, ao_progredir), ao_concluir
+        )
+
+    def mostrar_progresso_pdf(self, fracao):
+        self.botao_Download.config(text=f"PDF {fracao:.0%}")
+
+    def concluir_pdf(self, filepath, erro):
+        if erro is None:
             self.mostrar_popup_customizado(self.master, "Sucesso", f"Plano customizado salvo com sucesso em:\n{filepath}", tipo='info')
-        except PermissionError:
+        elif isinstance(erro, ImportError):
+            self.mostrar_popup_customizado(self.master, "Erro de Dependência",
+                                      "A biblioteca 'reportlab' é necessária para exportar PDF.\n\n"
+                                      "Feche o app, instale-a com:\n"
+                                      "py -m pip install reportlab\n\n"
+                                      "E tente novamente.",
+                                      tipo='erro')
+        elif isinstance(erro, PermissionError):
               self.mostrar_popup_customizado(self.master, "Erro de Permissão",
                                         "Não foi possível salvar o arquivo.\n\n"
                                         "Verifique se você tem permissão para salvar neste local "
                                         "ou se o arquivo já está aberto em outro programa.",
                                         tipo='erro')
-        except Exception as e:
-            self.mostrar_popup_customizado(self.master, "Erro ao Salvar PDF", f"Não foi possível salvar o arquivo PDF.\n\nDetalhe: {e}\n\n(Verifique se a fonte '{FONT_NAME_PDF}' está acessível)", tipo='erro')
+        else:
+            self.mostrar_popup_customizado(self.master, "Erro ao Salvar PDF", f"Não foi possível salvar o arquivo PDF.\n\nDetalhe: {erro}\n\n(Verifique se a fonte '{FONT_NAME_PDF}' está acessível)", tipo='erro')
 
 
 class AppController(tk.Tk):
@@ -818,12 +939,13 @@ class AppController(tk.Tk):
         fonte_padrao.configure(family=FONTE_APP, size=12)
         self.option_add("*Font", fonte_padrao)
 
-        if pygame:
+        if AUDIO_HABILITADO:
             inicializar_audio()
 
         self.df_cultivos = None
         self.df_eventos = None
         self.preco_semente_map = None
+        self.tabela_respostas = None
 
         self.splash_frame = None
         self.main_frame = None
@@ -848,6 +970,9 @@ class AppController(tk.Tk):
         self.splash_frame.pack(fill="both", expand=True)
         self.deiconify()
 
+        if RELATORIO_IMPORTACAO:
+            self.after_idle(relatorio_primeiro_quadro)
+
     def load_data(self):
         print("Carregando dados (Cultivos.csv)...")
         try:
@@ -858,6 +983,8 @@ class AppController(tk.Tk):
             print("Pré-calculando mapa de preços...")
             self.preco_semente_map = get_preco_semente_map(self.df_cultivos)
 
+            # A tabela de respostas do ano é montada em segundo plano pela FarmApp.
+
             print("✅ Dados carregados com sucesso em cache.")
 
             if self.splash_frame.winfo_exists():
@@ -889,7 +1016,8 @@ class AppController(tk.Tk):
             master=self,
             df_cultivos=self.df_cultivos,
             df_eventos=self.df_eventos,
-            preco_semente_map=self.preco_semente_map
+            preco_semente_map=self.preco_semente_map,
+            tabela_respostas=self.tabela_respostas
         )
 
         w, h = self.main_frame.width, self.main_frame.height
@@ -0,0 +1,220 @@
+import math
+import numpy as np
+from unidecode import unidecode
+
+MAX_BALDES_ORCAMENTO = 2048
+# Limite de células (quadrados x baldes x cultivos) visitadas quando o número de quadrados restringe a solução.
+LIMITE_OPERACOES_MOCHILA = 15_000_000
+
+
+def _opcoes_por_quadrado(melhores_plantas, preco_semente_map):
+    opcoes = []
+    for p in melhores_plantas:
+        custo = preco_semente_map.get(unidecode(p["planta"].strip().lower()), 0)
+        opcoes.append({
+            "planta": p["planta"],
+            "custo": custo,
+            "lucro_total": p["lucro_total"],
+            "lucro_liquido": p["lucro_total"] - custo,
+        })
+    return opcoes
+
+
+def fronteira_pareto(opcoes, custo_balde):
+    # Mantém só as opções que nenhuma outra supera custando o mesmo ou menos (em baldes de orçamento).
+    # O custo é arredondado para cima, então a alocação nunca passa do orçamento.
+    for opcao in opcoes:
+        opcao["baldes"] = max(1, math.ceil(opcao["custo"] / custo_balde - 1e-9))
+    fronteira = []
+    melhor_ganho = 0.0
+    for opcao in sorted(opcoes, key=lambda o: (o["baldes"], -o["ganho"])):
+        if opcao["ganho"] > melhor_ganho:
+            fronteira.append(opcao)
+            melhor_ganho = opcao["ganho"]
+    return fronteira
+
+
+def casco_superior(fronteira):
+    # Envelope côncavo de (baldes, ganho) partindo da origem; a relaxação linear só usa cultivos desse casco.
+    casco = []
+    for opcao in fronteira:
+        while casco:
+            x2, y2 = opcao["baldes"], opcao["ganho"]
+            x1, y1 = casco[-1]["baldes"], casco[-1]["ganho"]
+            x0, y0 = (casco[-2]["baldes"], casco[-2]["ganho"]) if len(casco) > 1 else (0, 0.0)
+            if (x1 - x0) * (y2 - y0) - (y1 - y0) * (x2 - x0) >= 0:
+                casco.pop()
+            else:
+                break
+        casco.append(opcao)
+    return casco
+
+
+def _discretizar_orcamento(opcoes, orcamento, max_baldes):
+    divisor = 0
+    for o in opcoes:
+        divisor = math.gcd(divisor, int(o["custo"]))
+    if divisor and all(o["custo"] == int(o["custo"]) for o in opcoes) and orcamento // divisor <= max_baldes:
+        return divisor, int(orcamento // divisor), True
+    return orcamento / max_baldes, max_baldes, False
+
+
+def _mochila_orcamento(fronteira, baldes):
+    # Sem limite efetivo de quadrados: mochila ilimitada só no orçamento, com cada cultivo
+    # decomposto em lotes de 1, 2, 4, ... quadrados (cada lote é um item 0/1 vetorizado).
+    dp = np.zeros(baldes + 1, dtype=np.float64)
+    etapas = []
+    for j, opcao in enumerate(fronteira):
+        lote = 1
+        while opcao["baldes"] * lote <= baldes:
+            custo = opcao["baldes"] * lote
+            candidato = dp[:baldes + 1 - custo] + opcao["ganho"] * lote
+            melhora = np.zeros(baldes + 1, dtype=bool)
+            melhora[custo:] = candidato > dp[custo:]
+            dp[melhora] = candidato[melhora[custo:]]
+            etapas.append((j, lote, melhora))
+            lote *= 2
+
+    contagem = [0] * len(fronteira)
+    b = baldes
+    for j, lote, melhora in reversed(etapas):
+        if melhora[b]:
+            contagem[j] += lote
+            b -= fronteira[j]["baldes"] * lote
+    return contagem
+
+
+def _mochila_quadrados(fronteira, quantidade_quadrados, baldes):
+    # dp[b] = maior ganho sobre a base com até k quadrados pagos e custo <= b baldes.
+    dp = np.zeros(baldes + 1, dtype=np.float64)
+    escolhas = []
+    for _ in range(quantidade_quadrados):
+        novo = dp.copy()
+        escolha = np.full(baldes + 1, -1, dtype=np.int32)
+        for j, opcao in enumerate(fronteira):
+            c = opcao["baldes"]
+            if c > baldes:
+                break
+            candidato = dp[:baldes + 1 - c] + opcao["ganho"]
+            melhora = candidato > novo[c:]
+            novo[c:][melhora] = candidato[melhora]
+            escolha[c:][melhora] = j
+        if not (escolha >= 0).any():
+            break
+        escolhas.append(escolha)
+        dp = novo
+
+    contagem = [0] * len(fronteira)
+    b = baldes
+    for escolha in reversed(escolhas):
+        j = escolha[b]
+        if j >= 0:
+            contagem[j] += 1
+            b -= fronteira[j]["baldes"]
+    return contagem
+
+
+def _ganho(fronteira, contagem):
+    return sum(opcao["ganho"] * n for opcao, n in zip(fronteira, contagem))
+
+
+def _resolver_mochila(pagas, quantidade_quadrados, orcamento, max_baldes):
+    custo_balde, baldes, exato = _discretizar_orcamento(pagas, orcamento, max_baldes)
+    fronteira = fronteira_pareto(pagas, custo_balde)
+    if not fronteira:
+        return fronteira, [], exato
+
+    solucao = None
+    if quantidade_quadrados >= baldes // fronteira[0]["baldes"]:
+        solucao = (fronteira, _mochila_orcamento(fronteira, baldes))
+    elif quantidade_quadrados * (baldes + 1) * len(fronteira) <= LIMITE_OPERACOES_MOCHILA:
+        solucao = (fronteira, _mochila_quadrados(fronteira, quantidade_quadrados, baldes))
+    if exato and solucao is not None:
+        return solucao[0], solucao[1], True
+
+    # Com o orçamento em baldes arredondados (ou uma mochila grande demais para rodar), compara com o melhor par
+    # de cultivos do casco a custo exato: a relaxação linear mistura no máximo dois cultivos.
+    casco = casco_superior(fronteira_pareto([dict(o) for o in pagas], 1))
+    par = (casco, _melhor_par(casco, quantidade_quadrados, orcamento))
+    if solucao is None or _ganho(*par) > _ganho(*solucao):
+        solucao = par
+    return solucao[0], solucao[1], False
+
+
+def _melhor_par(casco, quantidade_quadrados, orcamento):
+    maximo = min(quantidade_quadrados, int(orcamento // min(o["custo"] for o in casco)))
+    quantidades = np.arange(maximo + 1, dtype=np.float64)
+    melhor_ganho, melhor = 0.0, [0] * len(casco)
+    for i, a in enumerate(casco):
+        resto = orcamento - a["custo"] * quantidades
+        for k in range(i, len(casco)):
+            b = casco[k]
+            if k == i:
+                qtd_b = np.zeros_like(quantidades)
+            else:
+                qtd_b = np.clip(np.minimum(quantidade_quadrados - quantidades, np.floor(resto / b["custo"])), 0, None)
+            ganho = np.where(resto >= 0, a["ganho"] * quantidades + b["ganho"] * qtd_b, -np.inf)
+            x = int(np.argmax(ganho))
+            if ganho[x] > melhor_ganho:
+                melhor_ganho = ganho[x]
+                melhor = [0] * len(casco)
+                melhor[i] += x
+                melhor[k] += int(qtd_b[x])
+    return melhor
+
+
+def otimizar_alocacao(melhores_plantas, preco_semente_map, quantidade_quadrados, orcamento=None,
+                      max_baldes=MAX_BALDES_ORCAMENTO):
+    opcoes = _opcoes_por_quadrado(melhores_plantas, preco_semente_map)
+    quantidade_quadrados = int(quantidade_quadrados)
+
+    # Cultivos sem custo de semente formam a base: ocupam todo quadrado que não receber um cultivo pago.
+    gratuitas = [o for o in opcoes if o["custo"] <= 0 and o["lucro_liquido"] > 0]
+    base = max(gratuitas, key=lambda o: o["lucro_liquido"]) if gratuitas else None
+    valor_base = base["lucro_liquido"] if base else 0.0
+
+    pagas = []
+    for o in opcoes:
+        if o["custo"] > 0 and o["lucro_liquido"] > valor_base:
+            pagas.append(dict(o, ganho=o["lucro_liquido"] - valor_base))
+
+    exato = True
+    contagem = {}
+    if pagas and quantidade_quadrados > 0:
+        if orcamento is None:
+            melhor = max(pagas, key=lambda o: o["ganho"])
+            contagem[melhor["planta"]] = quantidade_quadrados
+        elif orcamento > 0:
+            fronteira, contagem_fronteira, exato = _resolver_mochila(pagas, quantidade_quadrados, orcamento, max_baldes)
+            for opcao, n in zip(fronteira, contagem_fronteira):
+                if n:
+                    contagem[opcao["planta"]] = n
+
+    pagos = sum(contagem.values())
+    if base is not None and quantidade_quadrados > pagos:
+        contagem[base["planta"]] = contagem.get(base["planta"], 0) + quantidade_quadrados - pagos
+
+    por_planta = {o["planta"]: o for o in opcoes}
+    alocacao = []
+    for planta, n in contagem.items():
+        o = por_planta[planta]
+        alocacao.append({
+            "planta": planta,
+            "quadrados": n,
+            "custo_sementes": o["custo"] * n,
+            "lucro_total": o["lucro_total"] * n,
+            "lucro_liquido": o["lucro_liquido"] * n,
+        })
+    alocacao.sort(key=lambda a: -a["lucro_liquido"])
+
+    usados = sum(a["quadrados"] for a in alocacao)
+    return {
+        "quantidade_quadrados": quantidade_quadrados,
+        "orcamento": orcamento,
+        "alocacao": alocacao,
+        "quadrados_livres": quantidade_quadrados - usados,
+        "custo_total": sum(a["custo_sementes"] for a in alocacao),
+        "lucro_total": sum(a["lucro_total"] for a in alocacao),
+        "lucro_liquido": sum(a["lucro_liquido"] for a in alocacao),
+        "exato": exato,
+    }
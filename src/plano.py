@@ -0,0 +1,58 @@
+import math
+from dataclasses import dataclass, field, asdict
+
+
+@dataclass(slots=True)
+class CultivoPlano:
+    planta: str
+    estacoes: str
+    colheitas: int
+    lucro_unitario: float
+    lucro_por_quadrado: float
+    custo_sementes: float
+    lucro_total: float
+
+
+@dataclass(slots=True)
+class FestivalPlano:
+    estacao: str
+    dia: int
+    dia_semana: str
+    festival: str
+    afeta_cultivo: str
+    obs: str
+
+
+@dataclass(slots=True)
+class PlanoCultivo:
+    opcao_estrategia: str
+    quantidade: int
+    unidade: str
+    quantidade_quadrados: int
+    periodo: str
+    dias_totais: int
+    cultivos: list = field(default_factory=list)
+    # None quando os eventos não puderam ser carregados; o motivo fica em erro_festivais.
+    festivais: list = None
+    erro_festivais: str = None
+    # Divisão da área entre cultivos sob o orçamento de sementes (ver otimizador.otimizar_alocacao).
+    alocacao: dict = None
+    # Sequência de cultivos no mesmo quadrado ao longo do intervalo (ver sucessao.planejar_sucessao).
+    sucessao: dict = None
+    # Fluxo de caixa simulado a partir de um ouro inicial (ver simulador.simular_fluxo_caixa).
+    simulacao: dict = None
+    # Distribuição do lucro por quadrado sob variações sorteadas (ver sensibilidade.analisar_sensibilidade).
+    sensibilidade: dict = None
+
+
+def _valor_json(valor):
+    if isinstance(valor, float) and math.isnan(valor):
+        return None
+    return valor
+
+
+def plano_para_dict(plano):
+    dados = asdict(plano)
+    for festival in dados["festivais"] or []:
+        festival["obs"] = _valor_json(festival["obs"])
+    return dados
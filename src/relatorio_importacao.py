@@ -0,0 +1,46 @@
+import os
+import sys
+import subprocess
+
+# Módulos que não devem ser carregados só por importar a interface.
+MODULOS_SOB_DEMANDA = ["pandas", "pygame", "reportlab"]
+
+
+def medir_importacoes(modulo="main_app"):
+    diretorio = os.path.dirname(os.path.abspath(__file__))
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=diretorio, capture_output=True, text=True
+    )
+    if processo.returncode != 0:
+        raise RuntimeError(f"Falha ao importar '{modulo}':\n{processo.stderr}")
+
+    tempos = {}
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith("import time:") or "cumulative" in linha:
+            continue
+        proprio, cumulativo, nome = [parte.strip() for parte in linha.split(":", 1)[1].split("|")]
+        tempos[nome] = (int(proprio), int(cumulativo))
+    return tempos
+
+
+def gerar_relatorio(modulo="main_app", limite=15):
+    tempos = medir_importacoes(modulo)
+    raizes = {nome: tempo for nome, tempo in tempos.items() if "." not in nome}
+    total_us = sum(proprio for proprio, _ in tempos.values())
+
+    print(f"Importação de '{modulo}': {total_us / 1000:.1f} ms no total")
+    for nome, (_, cumulativo) in sorted(raizes.items(), key=lambda item: item[1][1], reverse=True)[:limite]:
+        print(f"  {cumulativo / 1000:8.1f} ms  {nome}")
+
+    indevidos = [nome for nome in MODULOS_SOB_DEMANDA if nome in raizes]
+    if indevidos:
+        print(f"❌ Módulos que deveriam ser carregados sob demanda: {', '.join(indevidos)}")
+    else:
+        print("✅ Nenhum módulo pesado carregado na importação.")
+    return not indevidos
+
+
+if __name__ == "__main__":
+    modulo = sys.argv[1] if len(sys.argv) > 1 else "main_app"
+    sys.exit(0 if gerar_relatorio(modulo) else 1)
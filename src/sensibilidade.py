@@ -0,0 +1,60 @@
+import numpy as np
+from config import (
+    TENTATIVAS_SENSIBILIDADE, MAX_TENTATIVAS_SENSIBILIDADE, VARIACAO_PRECO_SENSIBILIDADE, MULTIPLICADORES_QUALIDADE,
+    CHANCES_QUALIDADE, CHANCE_COLHEITA_EXTRA
+)
+from logica import avaliar_plantas_vetorizado, multiplicadores_colheita
+
+PERCENTIS = (5, 50, 95)
+
+
+def sortear_lucros(ranking, tentativas, rng, variacao_preco=VARIACAO_PRECO_SENSIBILIDADE):
+    # Matriz (tentativas x cultivos) com o lucro por quadrado de cada sorteio.
+    nomes = ranking["planta"]
+    colheitas = ranking["colheitas_possiveis"]
+    multiplicador = multiplicadores_colheita(nomes)
+    preco_base = ranking["lucro_unit"] / multiplicador
+    forma = (tentativas, len(nomes))
+
+    fator_preco = np.clip(rng.normal(1.0, variacao_preco, size=forma), 0.0, None)
+
+    # Qualidade sorteada colheita a colheita: só a soma por faixa importa para o valor final.
+    faixas = rng.multinomial(np.broadcast_to(colheitas, forma), CHANCES_QUALIDADE)
+    fator_qualidade = faixas @ np.asarray(MULTIPLICADORES_QUALIDADE, dtype=np.float64)
+
+    # Cada colheita rende o multiplicador do cultivo e pode dar um item extra.
+    extras = rng.binomial(np.broadcast_to(colheitas, forma), CHANCE_COLHEITA_EXTRA)
+    itens_por_colheita = multiplicador + extras / np.maximum(colheitas, 1)
+
+    return preco_base * fator_preco * fator_qualidade * itens_por_colheita
+
+
+def analisar_sensibilidade(metricas, cultivos_df, tentativas=TENTATIVAS_SENSIBILIDADE, semente=0):
+    ranking = avaliar_plantas_vetorizado(metricas, cultivos_df)
+    tentativas = int(tentativas)
+    if tentativas <= 0 or tentativas > MAX_TENTATIVAS_SENSIBILIDADE:
+        raise ValueError(f"Número de tentativas inválido: {tentativas}. Informe um valor entre 1 e {MAX_TENTATIVAS_SENSIBILIDADE}.")
+
+    cultivos = []
+    if len(ranking):
+        lucros = sortear_lucros(ranking, tentativas, np.random.default_rng(semente))
+        media = lucros.mean(axis=0)
+        percentis = np.percentile(lucros, PERCENTIS, axis=0)
+        primeiro = np.bincount(np.argmax(lucros, axis=1), minlength=len(ranking)) / tentativas
+        for i in np.argsort(-media, kind="stable").tolist():
+            cultivos.append({
+                "planta": ranking["planta"][i],
+                "lucro_base": float(ranking["lucro_total"][i]),
+                "media": float(media[i]),
+                "desvio": float(lucros[:, i].std()),
+                "p5": float(percentis[0, i]),
+                "p50": float(percentis[1, i]),
+                "p95": float(percentis[2, i]),
+                "chance_primeiro": float(primeiro[i]),
+            })
+
+    return {
+        "tentativas": tentativas,
+        "semente": semente,
+        "cultivos": cultivos,
+    }
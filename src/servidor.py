@@ -0,0 +1,269 @@
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import argparse
+import json
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+from unidecode import unidecode
+from config import (
+    HOST_SERVIDOR, PORTA_SERVIDOR, TRABALHADORES_SERVIDOR, JANELA_METRICAS_LATENCIA,
+    USAR_TABELA_RESPOSTAS, ESTACOES, DIAS_POR_ESTACAO
+)
+from logica import carregar_cultivos, carregar_eventos, get_preco_semente_map, calendario_anotado
+from tabela_respostas import obter_tabela_respostas
+from tratamento_dados import gerar_plano, parse_intervalo_data, estatisticas_cache_planos, validar_quantidade
+from tratamento_menssagem import listar_feriados_do_periodo, renderizar_texto_plano
+from plano import plano_para_dict
+from instrumentacao import REGISTRO
+
+LIMITE_CORPO_REQUISICAO = 8 * 1024 * 1024
+
+
+class MetricasLatencia:
+    def __init__(self, janela=JANELA_METRICAS_LATENCIA):
+        self.janela = janela
+        self._rotas = {}
+        self._lock = threading.Lock()
+
+    def registrar(self, rota, duracao, erro=False):
+        with self._lock:
+            dados = self._rotas.get(rota)
+            if dados is None:
+                dados = self._rotas[rota] = {"total": 0, "erros": 0, "soma": 0.0, "amostras": deque(maxlen=self.janela)}
+            dados["total"] += 1
+            dados["soma"] += duracao
+            dados["amostras"].append(duracao)
+            if erro:
+                dados["erros"] += 1
+
+    def resumo(self):
+        with self._lock:
+            copia = {rota: (d["total"], d["erros"], d["soma"], sorted(d["amostras"])) for rota, d in self._rotas.items()}
+
+        def percentil(amostras, p):
+            return amostras[min(len(amostras) - 1, int(p * len(amostras)))] * 1000
+
+        return {
+            rota: {
+                "requisicoes": total,
+                "erros": erros,
+                "media_ms": soma / total * 1000,
+                "p50_ms": percentil(amostras, 0.50),
+                "p95_ms": percentil(amostras, 0.95),
+                "max_ms": amostras[-1] * 1000,
+            }
+            for rota, (total, erros, soma, amostras) in copia.items()
+        }
+
+
+def _json_seguro(valor):
+    if isinstance(valor, float) and math.isnan(valor):
+        return None
+    if isinstance(valor, dict):
+        return {chave: _json_seguro(v) for chave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_json_seguro(v) for v in valor]
+    return valor
+
+
+class ErroRequisicao(Exception):
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+
+
+class ServidorPlanejamento(HTTPServer):
+    # Cada conexão é atendida por um pool fixo de threads, em vez de uma thread nova por conexão.
+    def __init__(self, endereco, contexto, trabalhadores=TRABALHADORES_SERVIDOR):
+        super().__init__(endereco, ManipuladorPlanejamento)
+        self.contexto = contexto
+        self.metricas = MetricasLatencia()
+        self.executor = ThreadPoolExecutor(max_workers=trabalhadores, thread_name_prefix="servidor")
+        self.inicio = time.time()
+
+    def process_request(self, request, client_address):
+        self.executor.submit(self._atender, request, client_address)
+
+    def _atender(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+class ManipuladorPlanejamento(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = 5
+    server_version = "FarmPlanner/1.0"
+
+    ROTAS_GET = {
+        "/saude": "rota_saude",
+        "/calendario": "rota_calendario",
+        "/festivais": "rota_festivais",
+        "/metricas": "rota_metricas",
+    }
+    ROTAS_POST = {
+        "/plano": "rota_plano",
+    }
+
+    def do_GET(self):
+        self._despachar(self.ROTAS_GET)
+
+    def do_POST(self):
+        self._despachar(self.ROTAS_POST)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _despachar(self, rotas):
+        inicio = time.perf_counter()
+        url = urlsplit(self.path)
+        rota = url.path.rstrip("/") or "/"
+        metodo = rotas.get(rota)
+        try:
+            if metodo is None:
+                raise ErroRequisicao(404, f"Rota desconhecida: {self.command} {rota}")
+            status, corpo = getattr(self, metodo)(parse_qs(url.query))
+        except ErroRequisicao as e:
+            status, corpo = e.status, {"erro": str(e)}
+        except Exception as e:
+            status, corpo = 500, {"erro": f"{type(e).__name__}: {e}"}
+        self._responder(status, corpo)
+        if metodo is not None:
+            self.server.metricas.registrar(rota, time.perf_counter() - inicio, erro=status >= 400)
+
+    def _responder(self, status, corpo):
+        dados = json.dumps(_json_seguro(corpo), ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(dados)))
+        self.end_headers()
+        self.wfile.write(dados)
+
+    def _ler_json(self):
+        tamanho = int(self.headers.get("Content-Length") or 0)
+        if tamanho <= 0:
+            raise ErroRequisicao(400, "Corpo da requisição vazio.")
+        if tamanho > LIMITE_CORPO_REQUISICAO:
+            raise ErroRequisicao(413, "Corpo da requisição muito grande.")
+        try:
+            return json.loads(self.rfile.read(tamanho))
+        except json.JSONDecodeError as e:
+            raise ErroRequisicao(400, f"JSON inválido: {e}")
+
+    def _gerar_plano(self, dados_entrada, formato):
+        if not isinstance(dados_entrada, dict):
+            raise ErroRequisicao(400, "Cada requisição de plano deve ser um objeto JSON.")
+        faltando = [campo for campo in ("opcao_estrategia", "quantidade", "data_inicio") if campo not in dados_entrada]
+        if faltando:
+            raise ErroRequisicao(400, f"Campos obrigatórios ausentes: {', '.join(faltando)}")
+        try:
+            validar_quantidade(dados_entrada["quantidade"])
+        except ValueError as e:
+            raise ErroRequisicao(400, str(e))
+        df_cultivos, df_eventos, preco_semente_map, tabela_respostas = self.server.contexto
+        try:
+            plano = gerar_plano(dados_entrada, df_cultivos, df_eventos, preco_semente_map, tabela_respostas)
+        except (ValueError, TypeError) as e:
+            raise ErroRequisicao(400, str(e))
+        return plano_para_dict(plano) if formato == "json" else renderizar_texto_plano(plano)
+
+    def rota_saude(self, parametros):
+        return 200, {"status": "ok", "ativo_ha_s": round(time.time() - self.server.inicio, 1)}
+
+    def rota_plano(self, parametros):
+        formato = parametros.get("formato", ["texto"])[0]
+        if formato not in ("texto", "json"):
+            raise ErroRequisicao(400, f"Formato de plano inválido: '{formato}'. Use 'texto' ou 'json'.")
+        corpo = self._ler_json()
+        if isinstance(corpo, list):
+            resultados = []
+            for indice, dados_entrada in enumerate(corpo):
+                try:
+                    resultados.append({"indice": indice, "plano": self._gerar_plano(dados_entrada, formato), "erro": None})
+                except ErroRequisicao as e:
+                    resultados.append({"indice": indice, "plano": None, "erro": str(e)})
+                except Exception as e:
+                    # Uma falha inesperada num item não derruba os demais resultados da lista.
+                    resultados.append({"indice": indice, "plano": None, "erro": f"{type(e).__name__}: {e}"})
+            return 200, {"resultados": resultados}
+        return 200, {"plano": self._gerar_plano(corpo, formato)}
+
+    def rota_calendario(self, parametros):
+        calendario = calendario_anotado(self.server.contexto[1])
+        estacao = parametros.get("estacao", [None])[0]
+        if estacao is None:
+            return 200, {"dias": calendario["dias"]}
+        estacoes = [unidecode(e.lower()) for e in ESTACOES]
+        estacao_norm = unidecode(estacao.strip().lower())
+        if estacao_norm not in estacoes:
+            raise ErroRequisicao(400, f"Estação desconhecida: '{estacao}'.")
+        inicio = estacoes.index(estacao_norm) * DIAS_POR_ESTACAO
+        return 200, {"estacao": estacao_norm, "dias": calendario["dias"][inicio:inicio + DIAS_POR_ESTACAO]}
+
+    def rota_festivais(self, parametros):
+        periodo = parametros.get("periodo", [None])[0]
+        if periodo is None:
+            return 200, {"festivais": calendario_anotado(self.server.contexto[1])["festivais"]}
+        try:
+            metricas = parse_intervalo_data(periodo)
+        except ValueError as e:
+            raise ErroRequisicao(400, str(e))
+        return 200, {"periodo": periodo, "festivais": listar_feriados_do_periodo(metricas, self.server.contexto[1])}
+
+    def rota_metricas(self, parametros):
+        corpo = {"rotas": self.server.metricas.resumo(), "cache_planos": estatisticas_cache_planos()}
+        if REGISTRO.habilitado:
+            corpo["etapas"] = REGISTRO.resumo()
+        return 200, corpo
+
+
+def criar_servidor(host=HOST_SERVIDOR, porta=PORTA_SERVIDOR, trabalhadores=TRABALHADORES_SERVIDOR, usar_tabela=USAR_TABELA_RESPOSTAS):
+    df_cultivos = carregar_cultivos()
+    df_eventos = carregar_eventos()
+    preco_semente_map = get_preco_semente_map(df_cultivos)
+    tabela_respostas = obter_tabela_respostas(df_cultivos) if usar_tabela else None
+    calendario_anotado(df_eventos)
+    contexto = (df_cultivos, df_eventos, preco_semente_map, tabela_respostas)
+    return ServidorPlanejamento((host, porta), contexto, trabalhadores)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.servidor", description="Serviço local de planejamento em JSON.")
+    parser.add_argument("--host", default=HOST_SERVIDOR, help=f"Endereço de escuta (padrão: {HOST_SERVIDOR}).")
+    parser.add_argument("--porta", type=int, default=PORTA_SERVIDOR, help=f"Porta (padrão: {PORTA_SERVIDOR}).")
+    parser.add_argument("--trabalhadores", type=int, default=TRABALHADORES_SERVIDOR, help="Threads de atendimento.")
+    parser.add_argument("--sem-tabela", action="store_true", help="Não usa a tabela de respostas pré-calculada.")
+    args = parser.parse_args(argv)
+
+    servidor = criar_servidor(args.host, args.porta, args.trabalhadores, USAR_TABELA_RESPOSTAS and not args.sem_tabela)
+    host, porta = servidor.server_address[:2]
+    print(f"✅ Servidor de planejamento em http://{host}:{porta} ({args.trabalhadores} trabalhadores)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\nEncerrando servidor...")
+    finally:
+        servidor.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
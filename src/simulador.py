@@ -0,0 +1,120 @@
+import heapq
+import numpy as np
+from logica import calendario_anotado
+from sucessao import cultivos_do_intervalo, rotulo_dia
+from tabela_respostas import dia_do_ano
+
+# Ordem dos eventos no mesmo dia: o ouro das vendas da noite anterior entra antes das compras e as colheitas fecham o dia.
+VENDA, COMPRA, COLHEITA = 0, 1, 2
+
+
+def dias_lojas_fechadas(df_eventos, inicio, dias):
+    calendario = calendario_anotado(df_eventos)["dias"]
+    return {t for t in range(dias) if calendario[inicio + t]["afeta_cultivo"] in ("sim", "parcial")}
+
+
+def _vida_util(acumulado, dias):
+    # vida[c, s]: dias seguidos a partir de s em que o cultivo c continua numa estação em que cresce.
+    cresce = np.diff(acumulado, axis=1) > 0
+    vida = np.zeros(acumulado.shape, dtype=np.int64)
+    for s in range(dias - 1, -1, -1):
+        vida[:, s] = np.where(cresce[:, s], vida[:, s + 1] + 1, 0)
+    return vida
+
+
+def _opcoes_do_dia(cultivos, vida, s):
+    g = cultivos["dias_cresc"]
+    passo = cultivos["intervalo"]
+    fim_vida = s + vida[:, s]
+    primeira = s + g
+    possivel = (cultivos["compravel"] & (cultivos["custo"] > 0) & (primeira <= fim_vida)
+                & (s >= cultivos["primeiro_plantio"]))
+    colheitas = np.where(passo > 0, 1 + (fim_vida - primeira) // np.maximum(passo, 1), 1)
+    colheitas = np.where(possivel, colheitas, 0)
+    ultima = primeira + (colheitas - 1) * passo
+    lucro = colheitas * cultivos["lucro_colheita"] - cultivos["custo"]
+    taxa = np.where(possivel & (lucro > 0), lucro / np.maximum(ultima - s, 1), 0.0)
+    return taxa, colheitas
+
+
+def simular_fluxo_caixa(metricas, cultivos_df, df_eventos, preco_semente_map, ouro_inicial, quantidade_quadrados):
+    inicio = dia_do_ano(metricas["estacao_ini"], metricas["dia_ini"])
+    fim = dia_do_ano(metricas["estacao_fim"], metricas["dia_fim"])
+    dias = 0 if inicio is None or fim is None else max(0, fim - inicio + 1)
+    quantidade_quadrados = int(quantidade_quadrados)
+
+    ouro = float(ouro_inicial)
+    livres = quantidade_quadrados
+    compras = []
+    fechadas = set()
+    saldo_diario = []
+    total_sementes = total_vendas = 0.0
+    pico_plantados = 0
+
+    if dias:
+        cultivos = cultivos_do_intervalo(cultivos_df, preco_semente_map, inicio, dias)
+        vida = _vida_util(cultivos["acumulado"], dias)
+        fechadas = dias_lojas_fechadas(df_eventos, inicio, dias)
+
+        # Sem cultivo elegível no intervalo não há compra a fazer: o saldo fica parado no ouro inicial.
+        eventos = [(s, COMPRA, s, None) for s in range(dias) if s not in fechadas and len(cultivos["planta"])]
+        heapq.heapify(eventos)
+        sequencia = dias
+
+        dia_atual = 0
+        while eventos:
+            dia, tipo, _, dados = heapq.heappop(eventos)
+            while dia_atual < min(dia, dias):
+                saldo_diario.append(ouro)
+                dia_atual += 1
+
+            if tipo == VENDA:
+                ouro += dados
+                total_vendas += dados
+            elif tipo == COLHEITA:
+                c, n, restantes = dados
+                sequencia += 1
+                heapq.heappush(eventos, (dia + 1, VENDA, sequencia, n * float(cultivos["lucro_colheita"][c])))
+                if restantes > 1:
+                    sequencia += 1
+                    heapq.heappush(eventos, (dia + int(cultivos["intervalo"][c]), COLHEITA, sequencia, (c, n, restantes - 1)))
+                else:
+                    livres += n
+            elif livres > 0 and ouro > 0:
+                taxa, colheitas = _opcoes_do_dia(cultivos, vida, dia)
+                # Reinveste todo o ouro disponível: a cada rodada escolhe o cultivo com o maior lucro diário
+                # que o ouro e os quadrados livres ainda permitem plantar.
+                while livres > 0:
+                    quantidade = np.minimum(livres, ouro // np.maximum(cultivos["custo"], 1))
+                    c = int(np.argmax(taxa * quantidade))
+                    if taxa[c] * quantidade[c] <= 0:
+                        break
+                    n = int(quantidade[c])
+                    custo = n * float(cultivos["custo"][c])
+                    ouro -= custo
+                    total_sementes += custo
+                    livres -= n
+                    taxa[c] = 0.0
+                    compras.append({"dia": rotulo_dia(inicio + dia), "planta": str(cultivos["planta"][c]),
+                                    "quadrados": n, "custo": custo})
+                    sequencia += 1
+                    heapq.heappush(eventos, (dia + int(cultivos["dias_cresc"][c]) - 1, COLHEITA, sequencia,
+                                             (c, n, int(colheitas[c]))))
+                pico_plantados = max(pico_plantados, quantidade_quadrados - livres)
+        while dia_atual < dias:
+            saldo_diario.append(ouro)
+            dia_atual += 1
+
+    return {
+        "ouro_inicial": float(ouro_inicial),
+        "ouro_final": ouro,
+        "lucro": ouro - float(ouro_inicial),
+        "dias_totais": dias,
+        "quantidade_quadrados": quantidade_quadrados,
+        "pico_quadrados_plantados": pico_plantados,
+        "total_sementes": total_sementes,
+        "total_vendas": total_vendas,
+        "lojas_fechadas": [rotulo_dia(inicio + t) for t in sorted(fechadas)],
+        "compras": compras,
+        "saldo_diario": saldo_diario,
+    }
@@ -0,0 +1,132 @@
+import numpy as np
+from unidecode import unidecode
+from config import DIAS_POR_ESTACAO, DIA_PLANTIO_MINIMO_MORANGO
+from logica import mascaras_cultivos, colunas_avaliacao, multiplicadores_colheita, ESTACOES_NORMALIZADAS
+from tabela_respostas import dia_do_ano
+
+DIA_PLANTIO_MORANGO = dia_do_ano("primavera", DIA_PLANTIO_MINIMO_MORANGO)
+
+
+def rotulo_dia(dia_ano):
+    return f"{ESTACOES_NORMALIZADAS[dia_ano // DIAS_POR_ESTACAO].capitalize()} D{dia_ano % DIAS_POR_ESTACAO + 1}"
+
+
+def cultivos_do_intervalo(cultivos_df, preco_semente_map, inicio, dias):
+    colunas = colunas_avaliacao(cultivos_df)
+    mascaras = mascaras_cultivos(cultivos_df).astype(np.int64)
+
+    estacao_dia = (inicio + np.arange(dias)) // DIAS_POR_ESTACAO
+    mascara_intervalo = int(np.bitwise_or.reduce(1 << np.unique(estacao_dia)))
+    dias_cresc = colunas["dias_cresc"]
+    validos = (~np.isnan(dias_cresc) & (dias_cresc > 0) & (dias_cresc <= dias)
+               & (colunas["preco_venda"] > 0) & ((mascaras & mascara_intervalo) != 0))
+
+    nomes = colunas["cultivo"][validos]
+    multiplicador = multiplicadores_colheita(nomes)
+    intervalo = np.nan_to_num(colunas["intervalo_colheita"][validos])
+
+    # acumulado[c, t]: dias entre o início do intervalo e t em que o cultivo c cresce na estação.
+    cresce = (mascaras[validos][:, None] & (1 << estacao_dia)[None, :]) != 0
+    acumulado = np.zeros((len(nomes), dias + 1), dtype=np.int32)
+    np.cumsum(cresce, axis=1, out=acumulado[:, 1:])
+
+    if "compravel" in cultivos_df:
+        compravel = np.asarray(cultivos_df["compravel"])[validos] == "sim"
+    else:
+        compravel = np.ones(len(nomes), dtype=bool)
+
+    return {
+        "planta": nomes,
+        "dias_cresc": dias_cresc[validos].astype(np.int64),
+        "intervalo": intervalo.astype(np.int64),
+        "lucro_colheita": colunas["preco_venda"][validos] * multiplicador,
+        "custo": np.array([preco_semente_map.get(unidecode(str(n)), 0) for n in nomes.tolist()], dtype=np.float64),
+        "primeiro_plantio": np.where(nomes == "morango", max(0, DIA_PLANTIO_MORANGO - inicio), 0),
+        "compravel": compravel,
+        "acumulado": acumulado,
+    }
+
+
+def _programar(cultivos, dias):
+    # melhor[t]: maior lucro líquido com o quadrado livre no início do dia t do intervalo.
+    # colhido[c, t]: maior lucro com o cultivo c plantado e recém-colhido no dia t - 1 (ainda pode rebrotar).
+    n = len(cultivos["planta"])
+    g = cultivos["dias_cresc"]
+    passo = cultivos["intervalo"]
+    rebrota = passo > 0
+    acumulado = cultivos["acumulado"]
+    linhas = np.arange(n)
+
+    melhor = np.zeros(dias + 1, dtype=np.float64)
+    escolha = np.full(dias + 1, -1, dtype=np.int64)
+    colhido = np.full((n, dias + 1), -np.inf, dtype=np.float64)
+    continua = np.zeros((n, dias + 1), dtype=bool)
+
+    for t in range(1, dias + 1):
+        plantio = np.maximum(t - g, 0)
+        pode_plantar = ((t - g >= cultivos["primeiro_plantio"])
+                        & (acumulado[:, t] - acumulado[linhas, plantio] == g))
+        valor = np.where(pode_plantar, melhor[plantio] + cultivos["lucro_colheita"] - cultivos["custo"], -np.inf)
+
+        anterior = np.maximum(t - passo, 0)
+        pode_rebrotar = rebrota & (t - passo >= 1) & (acumulado[:, t] - acumulado[linhas, anterior] == passo)
+        valor_rebrota = np.where(pode_rebrotar, colhido[linhas, anterior] + cultivos["lucro_colheita"], -np.inf)
+
+        continua[:, t] = valor_rebrota > valor
+        colhido[:, t] = np.maximum(valor, valor_rebrota)
+
+        melhor[t] = melhor[t - 1]
+        if n:
+            c = int(np.argmax(colhido[:, t]))
+            if colhido[c, t] > melhor[t]:
+                melhor[t] = colhido[c, t]
+                escolha[t] = c
+    return melhor, escolha, continua
+
+
+def planejar_sucessao(metricas, cultivos_df, preco_semente_map, quantidade_quadrados=1):
+    inicio = dia_do_ano(metricas["estacao_ini"], metricas["dia_ini"])
+    fim = dia_do_ano(metricas["estacao_fim"], metricas["dia_fim"])
+    dias = 0 if inicio is None or fim is None else max(0, fim - inicio + 1)
+
+    etapas = []
+    if dias:
+        cultivos = cultivos_do_intervalo(cultivos_df, preco_semente_map, inicio, dias)
+        melhor, escolha, continua = _programar(cultivos, dias)
+
+        t = dias
+        while t > 0:
+            c = escolha[t]
+            if c < 0:
+                t -= 1
+                continue
+            fim_etapa = t
+            colheitas = 1
+            while continua[c, t]:
+                t -= cultivos["intervalo"][c]
+                colheitas += 1
+            t -= cultivos["dias_cresc"][c]
+            lucro_bruto = float(cultivos["lucro_colheita"][c] * colheitas)
+            custo = float(cultivos["custo"][c])
+            etapas.append({
+                "planta": str(cultivos["planta"][c]),
+                "plantio": rotulo_dia(inicio + t),
+                "ultimo_dia": rotulo_dia(inicio + fim_etapa - 1),
+                "colheitas": colheitas,
+                "custo_sementes": custo,
+                "lucro_bruto": lucro_bruto,
+                "lucro_liquido": lucro_bruto - custo,
+            })
+        etapas.reverse()
+
+    lucro_por_quadrado = sum(e["lucro_liquido"] for e in etapas)
+    custo_por_quadrado = sum(e["custo_sementes"] for e in etapas)
+    return {
+        "dias_totais": dias,
+        "quantidade_quadrados": quantidade_quadrados,
+        "etapas": etapas,
+        "custo_por_quadrado": custo_por_quadrado,
+        "lucro_liquido_por_quadrado": lucro_por_quadrado,
+        "custo_total": custo_por_quadrado * quantidade_quadrados,
+        "lucro_liquido": lucro_por_quadrado * quantidade_quadrados,
+    }
@@ -0,0 +1,66 @@
+import numpy as np
+
+
+class TabelaColunar:
+    def __init__(self, colunas, attrs=None):
+        self._colunas = {nome: np.asarray(valores) for nome, valores in colunas.items()}
+        self.attrs = dict(attrs or {})
+
+    @property
+    def columns(self):
+        return list(self._colunas)
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    def __getitem__(self, nome):
+        return self._colunas[nome]
+
+    def __setitem__(self, nome, valores):
+        self._colunas[nome] = np.asarray(valores)
+
+    def __contains__(self, nome):
+        return nome in self._colunas
+
+    def __len__(self):
+        for valores in self._colunas.values():
+            return len(valores)
+        return 0
+
+    def filtrar(self, mascara):
+        return TabelaColunar({nome: valores[mascara] for nome, valores in self._colunas.items()}, self.attrs)
+
+    def linhas(self):
+        nomes = self.columns
+        for valores in zip(*(self._colunas[nome].tolist() for nome in nomes)):
+            yield dict(zip(nomes, valores))
+
+    def colunas(self):
+        return dict(self._colunas)
+
+    def para_dataframe(self):
+        import pandas as pd
+        df = pd.DataFrame(self._colunas)
+        df.attrs.update(self.attrs)
+        return df
+
+
+def de_dataframe(df):
+    import pandas as pd
+    colunas = {}
+    for coluna in df.columns:
+        serie = df[coluna]
+        if pd.api.types.is_string_dtype(serie.dtype):
+            colunas[coluna] = serie.to_numpy(dtype=object)
+        elif pd.api.types.is_extension_array_dtype(serie.dtype):
+            colunas[coluna] = serie.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            colunas[coluna] = serie.to_numpy()
+    return TabelaColunar(colunas, df.attrs)
+
+
+def filtrar_linhas(tabela, mascara):
+    if isinstance(tabela, TabelaColunar):
+        return tabela.filtrar(mascara)
+    return tabela.loc[mascara]
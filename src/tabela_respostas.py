@@ -0,0 +1,108 @@
+import os
+import sys
+import pickle
+import hashlib
+import numpy as np
+from unidecode import unidecode
+from config import ESTACOES, DIAS_POR_ESTACAO, CACHE_TABELAS_RESPOSTAS_DIR, LIMITE_CULTIVOS_TABELA_RESPOSTAS
+from logica import cultivos_por_estacao, colunas_avaliacao, avaliar_colunas, ESTACOES_NORMALIZADAS
+
+TOTAL_DIAS_ANO = len(ESTACOES) * DIAS_POR_ESTACAO
+VERSAO_TABELA = 2
+
+COLUNAS_ASSINATURA = ["cultivo", "estacao", "dias_cresc", "intervalo_colheita", "preco_venda"]
+
+
+def assinatura_catalogo(cultivos_df):
+    h = hashlib.sha1()
+    for coluna in COLUNAS_ASSINATURA:
+        h.update(coluna.encode())
+        h.update(repr(np.asarray(cultivos_df[coluna]).tolist()).encode())
+    return h.hexdigest()
+
+def dia_do_ano(estacao, dia):
+    try:
+        idx = ESTACOES_NORMALIZADAS.index(unidecode(estacao.strip().lower()))
+    except (ValueError, AttributeError):
+        return None
+    if not isinstance(dia, int) or not 1 <= dia <= DIAS_POR_ESTACAO:
+        return None
+    return idx * DIAS_POR_ESTACAO + dia - 1
+
+def metricas_do_intervalo(inicio, fim):
+    return {
+        "estacao_ini": ESTACOES_NORMALIZADAS[inicio // DIAS_POR_ESTACAO].capitalize(),
+        "dia_ini": inicio % DIAS_POR_ESTACAO + 1,
+        "estacao_fim": ESTACOES_NORMALIZADAS[fim // DIAS_POR_ESTACAO].capitalize(),
+        "dia_fim": fim % DIAS_POR_ESTACAO + 1,
+    }
+
+def caminho_tabela_respostas(assinatura):
+    # Um arquivo por catálogo: alternar entre catálogos não reconstrói a tabela do outro.
+    return os.path.join(CACHE_TABELAS_RESPOSTAS_DIR, f"tabela_respostas_{assinatura[:16]}.pkl")
+
+def construir_tabela_respostas(cultivos_df, assinatura=None):
+    resultados = {}
+    colunas_por_estacoes = {}
+    for inicio in range(TOTAL_DIAS_ANO):
+        for fim in range(inicio, TOTAL_DIAS_ANO):
+            metricas = metricas_do_intervalo(inicio, fim)
+            chave_estacoes = (inicio // DIAS_POR_ESTACAO, fim // DIAS_POR_ESTACAO)
+            if chave_estacoes not in colunas_por_estacoes:
+                colunas_por_estacoes[chave_estacoes] = colunas_avaliacao(cultivos_por_estacao(metricas, cultivos_df))
+            resultados[(inicio, fim)] = avaliar_colunas(metricas, colunas_por_estacoes[chave_estacoes])
+    return {
+        "versao": VERSAO_TABELA,
+        "assinatura": assinatura or assinatura_catalogo(cultivos_df),
+        "resultados": resultados,
+    }
+
+def salvar_tabela_respostas(tabela, caminho=None):
+    caminho = caminho or caminho_tabela_respostas(tabela["assinatura"])
+    try:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        caminho_tmp = caminho + ".tmp"
+        with open(caminho_tmp, "wb") as f:
+            pickle.dump(tabela, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(caminho_tmp, caminho)
+        return True
+    except OSError as e:
+        print(f"⚠️ Não foi possível salvar a tabela de respostas em {caminho}: {e}")
+        return False
+
+def carregar_tabela_respostas(cultivos_df, caminho=None, assinatura=None):
+    assinatura = assinatura or assinatura_catalogo(cultivos_df)
+    caminho = caminho or caminho_tabela_respostas(assinatura)
+    if not os.path.exists(caminho):
+        return None
+    try:
+        with open(caminho, "rb") as f:
+            tabela = pickle.load(f)
+    except Exception as e:
+        print(f"⚠️ Tabela de respostas inválida em {caminho}: {e}")
+        return None
+
+    if tabela.get("versao") != VERSAO_TABELA or tabela.get("assinatura") != assinatura:
+        return None
+    return tabela
+
+def obter_tabela_respostas(cultivos_df, caminho=None, limite_cultivos=LIMITE_CULTIVOS_TABELA_RESPOSTAS):
+    if limite_cultivos is not None and len(cultivos_df) > limite_cultivos:
+        print(f"⚠️ Catálogo com {len(cultivos_df)} cultivos (limite {limite_cultivos}): "
+              "tabela de respostas desativada, planos calculados sob demanda.", file=sys.stderr)
+        return None
+    assinatura = assinatura_catalogo(cultivos_df)
+    tabela = carregar_tabela_respostas(cultivos_df, caminho, assinatura)
+    if tabela is None:
+        tabela = construir_tabela_respostas(cultivos_df, assinatura)
+        salvar_tabela_respostas(tabela, caminho)
+    return tabela
+
+def consultar_tabela_respostas(tabela, metricas):
+    if not tabela:
+        return None
+    inicio = dia_do_ano(metricas["estacao_ini"], metricas["dia_ini"])
+    fim = dia_do_ano(metricas["estacao_fim"], metricas["dia_fim"])
+    if inicio is None or fim is None:
+        return None
+    return tabela["resultados"].get((inicio, fim))
@@ -1,14 +1,25 @@
+import numbers
 import traceback
 from unidecode import unidecode
+from config import TAMANHO_CACHE_PLANOS, LIMITE_BYTES_CACHE_PLANOS, TENTATIVAS_SENSIBILIDADE, MAX_TENTATIVAS_SENSIBILIDADE
+from cache_resultados import CacheLRU
+from instrumentacao import cronometrar
+from plano import PlanoCultivo, CultivoPlano, FestivalPlano
 try:
-    from logica import carregar_cultivos, listar_plantas_possiveis, transformar_intervalo_em_dias
-    from tratamento_menssagem import criar_texto_plano_amigavel
+    from logica import carregar_cultivos, listar_plantas_possiveis, transformar_intervalo_em_dias, ranking_para_lista, versao_dados
+    from tabela_respostas import consultar_tabela_respostas
+    from tratamento_menssagem import renderizar_texto_plano, listar_feriados_do_periodo
+    from otimizador import otimizar_alocacao
+    from sucessao import planejar_sucessao
+    from simulador import simular_fluxo_caixa
+    from sensibilidade import analisar_sensibilidade
 except ImportError as e:
-    print(f"ERRO CRÍTICO NO TRATAMENTO.PY: Não foi possível importar módulos necessários. Detalhe: {e}")
-    def criar_texto_plano_amigavel(metricas, melhores_plantas, df_cultivos_cache, df_eventos_cache, preco_semente_map):
-        return f"ERRO CRÍTICO NA NARRATIVA: Falha na importação do arquivo narrativa.py. Verifique se o arquivo está salvo e no mesmo diretório. Detalhe: {e}"
+    raise ImportError(f"ERRO CRÍTICO NO TRATAMENTO.PY: Não foi possível importar módulos necessários. Detalhe: {e}")
 
+CACHE_PLANOS = CacheLRU(max_entradas=TAMANHO_CACHE_PLANOS, max_bytes=LIMITE_BYTES_CACHE_PLANOS)
 
+
+@cronometrar("parse")
 def parse_intervalo_data(data_str):
 
     try:
@@ -38,21 +49,122 @@ def parse_intervalo_data(data_str):
         raise ValueError(f"Falha ao analisar a string de data '{data_str}'. Detalhe: {e}")
 
 
-def tratar_e_processar_dados(dados_entrada, df_cultivos_cache, df_eventos_cache, preco_semente_map):
+def _chave_cache(metricas, df_cultivos_cache, df_eventos_cache):
+    return (
+        unidecode(metricas["estacao_ini"].strip().lower()), metricas["dia_ini"],
+        unidecode(metricas["estacao_fim"].strip().lower()), metricas["dia_fim"],
+        versao_dados(df_cultivos_cache), versao_dados(df_eventos_cache),
+    )
+
+
+def calcular_resultado_por_quadrado(metricas, df_cultivos_cache, df_eventos_cache, tabela_respostas=None):
+    try:
+        dias_totais = transformar_intervalo_em_dias(metricas)
+    except Exception as e:
+        dias_totais = 0
+        print(f"Erro ao calcular dias totais: {e}")
+
+    try:
+        ranking = consultar_tabela_respostas(tabela_respostas, metricas)
+        if ranking is not None:
+            melhores_plantas = ranking_para_lista(ranking)
+        else:
+            melhores_plantas = listar_plantas_possiveis(metricas, df_cultivos_cache)
+    except Exception as e:
+        print(f"Erro na execução da lógica do modelo (Carregar Cultivos ou Plantas Possíveis): {e}")
+        melhores_plantas = []
+
+    try:
+        feriados = listar_feriados_do_periodo(metricas, df_eventos_cache)
+    except Exception:
+        feriados = None
+
+    return {
+        "dias_totais": dias_totais,
+        "melhores_plantas": melhores_plantas,
+        "feriados": feriados,
+    }
+
+
+def obter_resultado_por_quadrado(metricas, df_cultivos_cache, df_eventos_cache, tabela_respostas=None, cache=CACHE_PLANOS):
+    if cache is None:
+        return calcular_resultado_por_quadrado(metricas, df_cultivos_cache, df_eventos_cache, tabela_respostas)
+
+    chave = _chave_cache(metricas, df_cultivos_cache, df_eventos_cache)
+    resultado = cache.obter(chave)
+    if resultado is None:
+        resultado = calcular_resultado_por_quadrado(metricas, df_cultivos_cache, df_eventos_cache, tabela_respostas)
+        if resultado["feriados"] is not None:
+            cache.guardar(chave, resultado)
+    return resultado
+
+
+def estatisticas_cache_planos():
+    return CACHE_PLANOS.estatisticas()
+
+
+def montar_plano(metricas, melhores_plantas, df_eventos_cache, preco_semente_map, feriados=None):
+    quantidade_quadrados = metricas["quantidade_quadrados"]
+
+    cultivos = []
+    for p in melhores_plantas:
+        planta_norm = unidecode(p["planta"].strip().lower())
+        cultivos.append(CultivoPlano(
+            planta=p["planta"],
+            estacoes=p["estacoes"],
+            colheitas=p["colheitas_possiveis"],
+            lucro_unitario=p["lucro_unit"],
+            lucro_por_quadrado=p["lucro_total"],
+            custo_sementes=preco_semente_map.get(planta_norm, 0) * quantidade_quadrados,
+            lucro_total=p["lucro_total"] * quantidade_quadrados,
+        ))
+
+    erro_festivais = None
+    try:
+        if feriados is None:
+            feriados = listar_feriados_do_periodo(metricas, df_eventos_cache)
+        festivais = [
+            FestivalPlano(f["estacao"], f["dia"], f["dia_semana"], f["festival"], f["afeta_cultivo"], f["obs"])
+            for f in feriados
+        ]
+    except Exception as e:
+        festivais = None
+        erro_festivais = str(e)
+
+    return PlanoCultivo(
+        opcao_estrategia=metricas["opcao_estrategia"],
+        quantidade=metricas["quantidade_input"],
+        unidade=metricas["unidade"],
+        quantidade_quadrados=quantidade_quadrados,
+        periodo=metricas["data_inicio"],
+        dias_totais=metricas["dias_totais"],
+        cultivos=cultivos,
+        festivais=festivais,
+        erro_festivais=erro_festivais,
+    )
+
+
+def validar_quantidade(quantidade_input):
+    if isinstance(quantidade_input, bool) or not isinstance(quantidade_input, numbers.Integral) or quantidade_input < 0:
+        raise ValueError(f"Quantidade inválida: {quantidade_input!r}. Informe um número inteiro maior ou igual a zero.")
+    return int(quantidade_input)
+
+def converter_quantidade(opcao, quantidade_input):
+    quantidade_input = validar_quantidade(quantidade_input)
+    if "Aspersor" in opcao:
+        return quantidade_input * 8, "Aspersores"
+    elif "Área Plantável" in opcao:
+        return quantidade_input, "Quadrados"
+    return quantidade_input, "Unidade(s)"
+
+
+def gerar_plano(dados_entrada, df_cultivos_cache, df_eventos_cache, preco_semente_map, tabela_respostas=None, cache=CACHE_PLANOS):
 
     opcao = dados_entrada["opcao_estrategia"]
     quantidade_input = dados_entrada["quantidade"]
     data_str = dados_entrada["data_inicio"]
 
-    if "Aspersor" in opcao:
-        quantidade_quadrados = quantidade_input * 8
-        unidade = "Aspersores"
-    elif "Área Plantável" in opcao:
-        quantidade_quadrados = quantidade_input
-        unidade = "Quadrados"
-    else:
-        quantidade_quadrados = quantidade_input
-        unidade = "Unidade(s)"
+    quantidade_quadrados, unidade = converter_quantidade(opcao, quantidade_input)
 
     metricas = parse_intervalo_data(data_str)
 
@@ -62,19 +174,34 @@ def tratar_e_processar_dados(dados_entrada, df_cultivos_cache, df_eventos_cache,
     metricas["data_inicio"] = data_str
     metricas["quantidade_quadrados"] = quantidade_quadrados
 
-    try:
-        metricas["dias_totais"] = transformar_intervalo_em_dias(metricas)
-    except Exception as e:
-        metricas["dias_totais"] = 0
-        print(f"Erro ao calcular dias totais: {e}")
-
-
-    try:
-        melhores_plantas = listar_plantas_possiveis(metricas, df_cultivos_cache)
-    except Exception as e:
-        print(f"Erro na execução da lógica do modelo (Carregar Cultivos ou Plantas Possíveis): {e}")
-        melhores_plantas = []
-
-    texto_final = criar_texto_plano_amigavel(metricas, melhores_plantas, df_cultivos_cache, df_eventos_cache, preco_semente_map)
-
-    return texto_final
\ No newline at end of file
+    resultado = obter_resultado_por_quadrado(metricas, df_cultivos_cache, df_eventos_cache, tabela_respostas, cache)
+    metricas["dias_totais"] = resultado["dias_totais"]
+
+    plano = montar_plano(metricas, resultado["melhores_plantas"], df_eventos_cache, preco_semente_map, resultado["feriados"])
+
+    # Modo de otimização: com "orcamento" na entrada (None = sem limite), divide a área entre vários cultivos.
+    if "orcamento" in dados_entrada:
+        orcamento = dados_entrada["orcamento"]
+        if orcamento is not None and orcamento < 0:
+            raise ValueError(f"Orçamento inválido: {orcamento}. Informe um valor positivo.")
+        plano.alocacao = otimizar_alocacao(resultado["melhores_plantas"], preco_semente_map, quantidade_quadrados, orcamento)
+    if dados_entrada.get("sucessao"):
+        plano.sucessao = planejar_sucessao(metricas, df_cultivos_cache, preco_semente_map, quantidade_quadrados)
+    if "ouro_inicial" in dados_entrada:
+        ouro_inicial = dados_entrada["ouro_inicial"]
+        if ouro_inicial is None or ouro_inicial < 0:
+            raise ValueError(f"Ouro inicial inválido: {ouro_inicial}. Informe um valor positivo.")
+        plano.simulacao = simular_fluxo_caixa(metricas, df_cultivos_cache, df_eventos_cache, preco_semente_map,
+                                              ouro_inicial, quantidade_quadrados)
+    sensibilidade = dados_entrada.get("sensibilidade")
+    if sensibilidade:
+        tentativas = TENTATIVAS_SENSIBILIDADE if sensibilidade is True else sensibilidade
+        if tentativas <= 0 or tentativas > MAX_TENTATIVAS_SENSIBILIDADE:
+            raise ValueError(f"Número de tentativas inválido: {tentativas}. Informe um valor entre 1 e {MAX_TENTATIVAS_SENSIBILIDADE}.")
+        plano.sensibilidade = analisar_sensibilidade(metricas, df_cultivos_cache, tentativas, dados_entrada.get("semente", 0))
+    return plano
+
+
+def tratar_e_processar_dados(dados_entrada, df_cultivos_cache, df_eventos_cache, preco_semente_map, tabela_respostas=None, cache=CACHE_PLANOS):
+    plano = gerar_plano(dados_entrada, df_cultivos_cache, df_eventos_cache, preco_semente_map, tabela_respostas, cache)
+    return renderizar_texto_plano(plano)
@@ -1,24 +1,18 @@
 from unidecode import unidecode
-import pandas as pd
 import traceback
 import os
-from config import ESTACOES
+from bisect import bisect_left, bisect_right
+from config import ESTACOES, DIAS_POR_ESTACAO
+from instrumentacao import cronometrar
+
+LIMITE_LINHAS_SENSIBILIDADE = 10
 
 try:
-    from logica import carregar_eventos, criar_calendario, anotar_feriados, carregar_cultivos
+    from logica import carregar_eventos, carregar_cultivos, calendario_anotado
 except ImportError as e:
     raise ImportError(f"Falha ao importar funções de modelo.py para narrativa.py. Garanta que 'carregar_cultivos' está no modelo. Detalhe: {e}")
 
-def _criar_calendario_completo(eventos_df):
-    todas_estacoes = [unidecode(e.lower()) for e in ESTACOES]
-    calendario_completo = []
-    for est in todas_estacoes:
-        calendario_completo.extend(criar_calendario(est))
-
-    return anotar_feriados(calendario_completo, eventos_df)
-
-
-def _filtrar_feriados_por_intervalo(metricas, calendario_completo):
+def _filtrar_feriados_por_intervalo(metricas, calendario):
 
     estacoes_lower = [unidecode(e.lower()) for e in ESTACOES]
     est_ini = unidecode(metricas["estacao_ini"].strip().lower())
@@ -31,97 +25,68 @@ def _filtrar_feriados_por_intervalo(metricas, calendario_completo):
         print(f"Erro ao encontrar índice da estação: {e}")
         return []
 
-    feriados_encontrados = []
-    for dia in calendario_completo:
-        if not dia.get("feriado"):
-            continue
+    dia_ini = min(max(metricas["dia_ini"], 1), DIAS_POR_ESTACAO + 1)
+    dia_fim = min(max(metricas["dia_fim"], 0), DIAS_POR_ESTACAO)
+    inicio = idx_ini * DIAS_POR_ESTACAO + dia_ini - 1
+    fim = idx_fim * DIAS_POR_ESTACAO + dia_fim - 1
 
-        est_atual_norm = dia["estacao"]
+    ordinais = calendario["ordinais_festivais"]
+    return calendario["festivais"][bisect_left(ordinais, inicio):bisect_right(ordinais, fim)]
 
-        try:
-            idx_atual = estacoes_lower.index(est_atual_norm)
-        except ValueError:
-            continue
 
-        dentro_do_intervalo = False
+@cronometrar("festivais")
+def listar_feriados_do_periodo(metricas, df_eventos_cache):
+    return _filtrar_feriados_por_intervalo(metricas, calendario_anotado(df_eventos_cache))
 
-        if idx_ini == idx_fim:
-            if idx_atual == idx_ini and metricas["dia_ini"] <= dia["dia"] <= metricas["dia_fim"]:
-                dentro_do_intervalo = True
-        elif idx_ini < idx_fim:
-            if idx_ini < idx_atual < idx_fim:
-                dentro_do_intervalo = True
-            elif idx_atual == idx_ini and dia["dia"] >= metricas["dia_ini"]:
-                dentro_do_intervalo = True
-            elif idx_atual == idx_fim and dia["dia"] <= metricas["dia_fim"]:
-                dentro_do_intervalo = True
 
-        if dentro_do_intervalo:
-            feriados_encontrados.append(dia)
+def formatar_gold(valor):
+    return f"{valor:,.0f}".replace(",", "_").replace(".", ",").replace("_", ".")
 
-    return feriados_encontrados
 
+@cronometrar("render_texto")
+def renderizar_texto_plano(plano):
 
-def criar_texto_plano_amigavel(metricas, melhores_plantas, df_cultivos_cache, df_eventos_cache, preco_semente_map):
+    texto_final = (f"--- 📑 Plano de Cultivo Otimizado | {plano.opcao_estrategia} ---\n"
+                   f"Área de Plantio: {plano.quantidade_quadrados} Quadrado(s)\n"
+                   f"Período de Análise: {plano.periodo}\n"
+                   f"Dias Úteis no Período: {plano.dias_totais}\n")
 
-
-    quantidade_input = metricas["quantidade_input"]
-    unidade = metricas["unidade"]
-    data_str = metricas["data_inicio"]
-    quantidade_quadrados = metricas["quantidade_quadrados"]
-    dias_totais = metricas["dias_totais"]
-    opcao = metricas["opcao_estrategia"]
-
-    texto_final = (f"--- 📑 Plano de Cultivo Otimizado | {opcao} ---\n"
-                   f"Área de Plantio: {quantidade_quadrados} Quadrado(s)\n"
-                   f"Período de Análise: {data_str}\n"
-                   f"Dias Úteis no Período: {dias_totais}\n")
-
-    if not melhores_plantas:
+    if not plano.cultivos:
         texto_final += "\nCultivos\n🌿 Nenhuma planta pode ser colhida neste período. Tente aumentar o intervalo ou rever as sementes disponíveis!"
     else:
         texto_final += f"\n--- 🌿Cultivos Otimizados - Ordenado por Lucro🌿 ---\n"
 
-        for i, p in enumerate(melhores_plantas):
-            planta_norm = unidecode(p['planta'].strip().lower())
-
-            preco_semente_unit = preco_semente_map.get(planta_norm, 0)
-            custo_semente_total = preco_semente_unit * quantidade_quadrados
+        for i, c in enumerate(plano.cultivos):
+            texto_final += (f"\n{i+1}. {c.planta.title()}\n"
+                            f"   ▪️ Colheitas Possíveis: {c.colheitas} vezes\n"
+                            f"   ▪️ Custo Total de Sementes: {formatar_gold(c.custo_sementes)} G\n"
+                            f"   ▪️ Lucro Total Projetado: {formatar_gold(c.lucro_total)} G")
 
-            lucro_campo_total = p["lucro_total"] * quantidade_quadrados
-            lucro_formatado = f"{lucro_campo_total:,.0f}".replace(",", "_").replace(".", ",").replace("_", ".")
-            custo_formatado = f"{custo_semente_total:,.0f}".replace(",", "_").replace(".", ",").replace("_", ".")
+    if plano.alocacao is not None:
+        texto_final += renderizar_texto_alocacao(plano.alocacao)
 
-            texto_final += (f"\n{i+1}. {p['planta'].title()}\n"
-                            f"   ▪️ Colheitas Possíveis: {p['colheitas_possiveis']} vezes\n"
-                            f"   ▪️ Custo Total de Sementes: {custo_formatado} G\n"
-                            f"   ▪️ Lucro Total Projetado: {lucro_formatado} G")
+    if plano.sucessao is not None:
+        texto_final += renderizar_texto_sucessao(plano.sucessao)
 
-    try:
-        calendario_completo = _criar_calendario_completo(df_eventos_cache)
-        feriados = _filtrar_feriados_por_intervalo(metricas, calendario_completo)
-
-        if feriados:
-            texto_final += "\n\n--- 🎉Eventos e Festivais no Período🎉 ---\n\n"
+    if plano.simulacao is not None:
+        texto_final += renderizar_texto_simulacao(plano.simulacao)
 
-            feriados_unicos = pd.DataFrame(feriados).drop_duplicates(subset=['estacao', 'dia']).to_dict('records')
+    if plano.sensibilidade is not None:
+        texto_final += renderizar_texto_sensibilidade(plano.sensibilidade)
 
-            for f in feriados_unicos:
-                afeta = f.get("afeta_cultivo", "nao")
+    if plano.festivais is None:
+        texto_final += f"[AVISO: Falha ao carregar Eventos/Festivais. Garanta que 'Estações e Festivais.csv' está acessível. Erro: {plano.erro_festivais}]"
+        return texto_final
 
-                if afeta == 'sim':
-                    status_icon = '✖️'
-                    status_text = 'Afeta Lojas/Área'
-                elif afeta == 'parcial':
-                    status_icon = '❗'
-                    status_text = 'Afeta Parcialmente'
-                else:
-                    status_icon = '✔️'
-                    status_text = 'Sem Impacto'
+    try:
+        if plano.festivais:
+            texto_final += "\n\n--- 🎉Eventos e Festivais no Período🎉 ---\n\n"
 
-                obs = f['obs'].capitalize().replace("nan", "N/A")
+            for f in plano.festivais:
+                status_icon, status_text = descrever_impacto(f.afeta_cultivo)
+                obs = f.obs.capitalize().replace("nan", "N/A")
 
-                texto_final += (f"\n  - {f['estacao'].capitalize()} D.{f['dia']} - {f['festival'].capitalize()}\n"
+                texto_final += (f"\n  - {f.estacao.capitalize()} D.{f.dia} - {f.festival.capitalize()}\n"
                                 f"   > Impacto: {status_icon} {status_text}\n"
                                 f"({obs})\n")
 
@@ -130,5 +95,75 @@ def criar_texto_plano_amigavel(metricas, melhores_plantas, df_cultivos_cache, df
 
     except Exception as e:
         texto_final += f"[AVISO: Falha ao carregar Eventos/Festivais. Garanta que 'Estações e Festivais.csv' está acessível. Erro: {e}]"
-        pass
-    return texto_final
\ No newline at end of file
+    return texto_final
+
+
+def renderizar_texto_alocacao(alocacao):
+    orcamento = alocacao["orcamento"]
+    limite = "sem limite" if orcamento is None else f"{formatar_gold(orcamento)} G"
+    texto = f"\n\n--- 🧮Divisão Otimizada da Área (Orçamento: {limite})🧮 ---\n"
+
+    if not alocacao["alocacao"]:
+        texto += "\n🌿 Nenhum cultivo cabe no orçamento informado."
+    for a in alocacao["alocacao"]:
+        texto += (f"\n  - {a['planta'].title()}: {a['quadrados']} Quadrado(s)\n"
+                  f"   ▪️ Sementes: {formatar_gold(a['custo_sementes'])} G | Lucro Líquido: {formatar_gold(a['lucro_liquido'])} G")
+
+    texto += (f"\n\nTotal: {formatar_gold(alocacao['custo_total'])} G em sementes, "
+              f"{formatar_gold(alocacao['lucro_liquido'])} G de lucro líquido")
+    if alocacao["quadrados_livres"]:
+        texto += f" ({alocacao['quadrados_livres']} quadrado(s) sem cultivo)"
+    return texto
+
+
+def renderizar_texto_sucessao(sucessao):
+    texto = "\n\n--- 🔁Sucessão de Cultivos no Mesmo Quadrado🔁 ---\n"
+
+    if not sucessao["etapas"]:
+        texto += "\n🌿 Nenhuma sequência de cultivos cabe neste período."
+    for i, e in enumerate(sucessao["etapas"]):
+        texto += (f"\n{i+1}. {e['planta'].title()}: {e['plantio']} -> {e['ultimo_dia']} ({e['colheitas']} colheita(s))\n"
+                  f"   ▪️ Sementes: {formatar_gold(e['custo_sementes'])} G | Lucro Líquido: {formatar_gold(e['lucro_liquido'])} G por quadrado")
+
+    texto += (f"\n\nTotal: {formatar_gold(sucessao['custo_total'])} G em sementes, "
+              f"{formatar_gold(sucessao['lucro_liquido'])} G de lucro líquido em {sucessao['quantidade_quadrados']} quadrado(s)")
+    return texto
+
+
+def renderizar_texto_simulacao(simulacao):
+    texto = f"\n\n--- 💰Simulação de Caixa (Ouro Inicial: {formatar_gold(simulacao['ouro_inicial'])} G)💰 ---\n"
+
+    if not simulacao["compras"]:
+        texto += "\n🌿 Nenhuma semente pôde ser comprada com o ouro disponível neste período."
+    for c in simulacao["compras"]:
+        texto += f"\n  - {c['dia']}: {c['quadrados']} Quadrado(s) de {c['planta'].title()} por {formatar_gold(c['custo'])} G"
+
+    if simulacao["lojas_fechadas"]:
+        texto += f"\n\nLojas fechadas em: {', '.join(simulacao['lojas_fechadas'])}"
+    texto += (f"\n\nOuro Final: {formatar_gold(simulacao['ouro_final'])} G "
+              f"(lucro de {formatar_gold(simulacao['lucro'])} G, até {simulacao['pico_quadrados_plantados']} quadrado(s) plantados)")
+    return texto
+
+
+def formatar_percentual(fracao):
+    return f"{fracao * 100:.1f}%".replace(".", ",")
+
+
+def renderizar_texto_sensibilidade(sensibilidade, limite=LIMITE_LINHAS_SENSIBILIDADE):
+    texto = f"\n\n--- 🎲Análise de Sensibilidade ({sensibilidade['tentativas']} sorteios)🎲 ---\n"
+
+    if not sensibilidade["cultivos"]:
+        texto += "\n🌿 Nenhuma planta pode ser colhida neste período."
+    for c in sensibilidade["cultivos"][:limite]:
+        texto += (f"\n  - {c['planta'].title()}: média {formatar_gold(c['media'])} G por quadrado\n"
+                  f"   ▪️ P5 {formatar_gold(c['p5'])} G | P50 {formatar_gold(c['p50'])} G | P95 {formatar_gold(c['p95'])} G"
+                  f" | 1º lugar em {formatar_percentual(c['chance_primeiro'])} dos sorteios")
+    return texto
+
+
+def descrever_impacto(afeta):
+    if afeta == 'sim':
+        return '✖️', 'Afeta Lojas/Área'
+    if afeta == 'parcial':
+        return '❗', 'Afeta Parcialmente'
+    return '✔️', 'Sem Impacto'
@@ -1,6 +1,12 @@
+import os
+import math
 import time
 import tkinter as tk
+from functools import lru_cache
 from PIL import Image, ImageDraw
+from config import (
+    CACHE_DIR, TAMANHO_CACHE_GRADIENTES, PERSISTIR_GRADIENTES, INTERVALO_ANIMACAO_MS, TAMANHO_CACHE_RAMPAS_CORES
+)
 
 
 def _hex_to_rgb(hex_color):
@@ -23,75 +29,87 @@ def _interpolate_color(start_color, end_color, fraction):
     return _rgb_to_hex(tuple(new_rgb))
 
 
-def animate_hover_color(widget, start_color, end_color, duration_ms=150):
-    if hasattr(widget, "_animation_id"):
-        try:
-            widget.after_cancel(widget._animation_id)
-        except tk.TclError:
-            pass
+@lru_cache(maxsize=TAMANHO_CACHE_RAMPAS_CORES)
+def _rampa_cores(start_color, end_color, duration_ms):
+    # Uma cor por quadro, calculada uma vez por (início, fim, duração); a última é sempre a cor final.
+    passos = max(1, math.ceil(duration_ms / INTERVALO_ANIMACAO_MS))
+    return tuple(_interpolate_color(start_color, end_color, i / passos) for i in range(passos)) + (end_color,)
 
-    start_time = time.time()
 
-    def animation_step():
-        elapsed_time = (time.time() - start_time) * 1000
-        fraction = elapsed_time / duration_ms
+class AgendadorAnimacoes:
+    # Um único after() avança todas as transições ativas, em vez de um laço por widget.
+    def __init__(self, intervalo_ms=INTERVALO_ANIMACAO_MS):
+        self.intervalo_ms = intervalo_ms
+        self._transicoes = {}
+        self._raiz = None
+        self._after_id = None
 
-        if fraction >= 1.0:
-            if widget.winfo_exists():
-                widget.config(fg=end_color)
-            if hasattr(widget, "_animation_id"):
-                delattr(widget, "_animation_id")
-            return
-            
-        current_color = _interpolate_color(start_color, end_color, fraction)
-        
-        try:
-            if widget.winfo_exists():
-                widget.config(fg=current_color)
-                widget._animation_id = widget.after(16, animation_step)
-            else:
-                if hasattr(widget, "_animation_id"):
-                    delattr(widget, "_animation_id")
-        except tk.TclError:
-            if hasattr(widget, "_animation_id"):
-                delattr(widget, "_animation_id")
+    def animar(self, widget, opcao, start_color, end_color, duration_ms=150):
+        rampa = _rampa_cores(start_color, end_color, duration_ms)
+        self._transicoes[(widget, opcao)] = {
+            "rampa": rampa, "duracao": duration_ms / 1000, "inicio": time.perf_counter(), "cor": None,
+        }
+        self._avancar(time.perf_counter())
+        self._agendar(widget)
 
-    animation_step()
+    def cancelar(self, widget, opcao=None):
+        for chave in [c for c in self._transicoes if c[0] is widget and (opcao is None or c[1] == opcao)]:
+            del self._transicoes[chave]
 
-def animate_hover_bg(widget, start_color, end_color, duration_ms=150):
-    if hasattr(widget, "_animation_id"):
-        try:
-            widget.after_cancel(widget._animation_id)
-        except tk.TclError:
-            pass
+    def ativas(self):
+        return len(self._transicoes)
 
-    start_time = time.time()
-    
-    def animation_step():
-        elapsed_time = (time.time() - start_time) * 1000
-        fraction = elapsed_time / duration_ms
-        
-        if fraction >= 1.0:
-            if widget.winfo_exists():
-                widget.config(bg=end_color)
-            if hasattr(widget, "_animation_id"):
-                delattr(widget, "_animation_id")
+    def _agendar(self, widget):
+        if self._after_id is not None or not self._transicoes:
             return
-            
-        current_color = _interpolate_color(start_color, end_color, fraction)
-        
         try:
-            if widget.winfo_exists():
-                widget.config(bg=current_color)
-                widget._animation_id = widget.after(16, animation_step)
-            else:
-                if hasattr(widget, "_animation_id"):
-                    delattr(widget, "_animation_id")
+            self._raiz = widget._root()
+            self._after_id = self._raiz.after(self.intervalo_ms, self._tick)
         except tk.TclError:
-            if hasattr(widget, "_animation_id"):
-                delattr(widget, "_animation_id")
+            self._transicoes.clear()
+
+    def _tick(self):
+        self._after_id = None
+        self._avancar(time.perf_counter())
+        if self._transicoes:
+            try:
+                self._after_id = self._raiz.after(self.intervalo_ms, self._tick)
+            except tk.TclError:
+                self._transicoes.clear()
+
+    def _avancar(self, agora):
+        for chave, transicao in list(self._transicoes.items()):
+            widget, opcao = chave
+            rampa = transicao["rampa"]
+            fracao = (agora - transicao["inicio"]) / transicao["duracao"] if transicao["duracao"] > 0 else 1.0
+            terminou = fracao >= 1.0
+            cor = rampa[-1] if terminou else rampa[int(fracao * (len(rampa) - 1))]
+            try:
+                if not widget.winfo_exists():
+                    del self._transicoes[chave]
+                    continue
+                # Vários quadros seguidos caem na mesma cor da rampa; só reconfigura quando ela muda.
+                if cor != transicao["cor"]:
+                    widget.configure({opcao: cor})
+                    transicao["cor"] = cor
+            except tk.TclError:
+                del self._transicoes[chave]
+                continue
+            if terminou:
+                del self._transicoes[chave]
+
+
+AGENDADOR_ANIMACOES = AgendadorAnimacoes()
+
 
-    animation_step()
+def animate_hover_color(widget, start_color, end_color, duration_ms=150):
+    AGENDADOR_ANIMACOES.animar(widget, "fg", start_color, end_color, duration_ms)
+
+def animate_hover_bg(widget, start_color, end_color, duration_ms=150):
+    AGENDADOR_ANIMACOES.animar(widget, "bg", start_color, end_color, duration_ms)
+
+def cancelar_animacao(widget, opcao=None):
+    AGENDADOR_ANIMACOES.cancelar(widget, opcao)
 
 
 def arredondar_cantos(imagem_pil, raio):
@@ -102,14 +120,39 @@ def arredondar_cantos(imagem_pil, raio):
     imagem_arredondada.putalpha(mascara)
     return imagem_arredondada
 
+def _cor_gradiente(cor_hex):
+    return int(cor_hex[1:3], 16), int(cor_hex[3:5], 16), int(cor_hex[5:7], 16)
+
+def _caminho_gradiente(width, height, color_start_hex, color_end_hex):
+    nome = f"{width}x{height}_{color_start_hex.lstrip('#')}_{color_end_hex.lstrip('#')}.png"
+    return os.path.join(CACHE_DIR, "gradientes", nome)
+
+@lru_cache(maxsize=TAMANHO_CACHE_GRADIENTES)
+def _gradiente(width, height, color_start_hex, color_end_hex):
+    caminho = _caminho_gradiente(width, height, color_start_hex, color_end_hex)
+    if PERSISTIR_GRADIENTES and os.path.exists(caminho):
+        try:
+            with Image.open(caminho) as imagem:
+                return imagem.convert("RGB")
+        except OSError:
+            pass
+
+    # Uma coluna com a cor de cada linha, esticada na horizontal: mesmos valores do preenchimento pixel a pixel.
+    inicio = _cor_gradiente(color_start_hex)
+    fim = _cor_gradiente(color_end_hex)
+    coluna = [tuple(int(a + (b - a) * (y / height)) for a, b in zip(inicio, fim)) for y in range(height)]
+    faixa = Image.new("RGB", (1, height))
+    faixa.putdata(coluna)
+    image = faixa.resize((width, height), Image.Resampling.NEAREST)
+
+    if PERSISTIR_GRADIENTES:
+        try:
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            image.save(caminho)
+        except OSError as e:
+            print(f"⚠️ Não foi possível salvar o gradiente em {caminho}: {e}")
+    return image
+
 def criar_imagem_gradiente(width, height, color_start_hex, color_end_hex):
-    start_r, start_g, start_b = int(color_start_hex[1:3], 16), int(color_start_hex[3:5], 16), int(color_start_hex[5:7], 16)
-    end_r, end_g, end_b = int(color_end_hex[1:3], 16), int(color_end_hex[3:5], 16), int(color_end_hex[5:7], 16)
-    image = Image.new("RGB", (width, height))
-    for y in range(height):
-        r = int(start_r + (end_r - start_r) * (y / height))
-        g = int(start_g + (end_g - start_g) * (y / height))
-        b = int(start_b + (end_b - start_b) * (y / height))
-        for x in range(width):
-            image.putpixel((x, y), (r, g, b))
-    return image
\ No newline at end of file
+    # Cópia: quem recebe pode desenhar na imagem sem alterar a versão em cache.
+    return _gradiente(width, height, color_start_hex, color_end_hex).copy()
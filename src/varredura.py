@@ -0,0 +1,171 @@
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+import argparse
+import colorsys
+import csv
+import time
+import numpy as np
+
+from config import (
+    ESTACOES, DIAS_POR_ESTACAO, CAMINHO_CULTIVOS_CSV, COR_CAL_DIA_BG, COR_CAL_INTERVALO_INICIO_FIM, COR_CAL_BORDA_POPUP
+)
+from logica import (
+    carregar_cultivos, cultivos_por_estacao, colunas_avaliacao, calcular_colheitas_vetorizado, dias_uteis_por_cultivo,
+    multiplicadores_colheita
+)
+from tabela_respostas import TOTAL_DIAS_ANO, metricas_do_intervalo
+from sucessao import rotulo_dia
+from tratamento_dados import converter_quantidade
+
+ESTRATEGIAS_VARREDURA = ["Aspersor - Nível 2", "Área Plantável"]
+COR_CELULA_INVALIDA = "#d9d9d9"
+
+
+def _bloco_estacoes(idx_ini, idx_fim, cultivos_df):
+    # Todos os intervalos que começam na estação idx_ini e terminam em idx_fim usam os mesmos cultivos elegíveis.
+    inicios, fins = np.meshgrid(np.arange(DIAS_POR_ESTACAO) + idx_ini * DIAS_POR_ESTACAO,
+                                np.arange(DIAS_POR_ESTACAO) + idx_fim * DIAS_POR_ESTACAO, indexing="ij")
+    validos = fins >= inicios
+    inicios, fins = inicios[validos], fins[validos]
+
+    metricas = metricas_do_intervalo(idx_ini * DIAS_POR_ESTACAO, idx_fim * DIAS_POR_ESTACAO)
+    colunas = colunas_avaliacao(cultivos_por_estacao(metricas, cultivos_df))
+    nomes = colunas["cultivo"]
+
+    dias_util = dias_uteis_por_cultivo(nomes, fins - inicios + 1, metricas["estacao_ini"], inicios % DIAS_POR_ESTACAO + 1,
+                                       metricas["estacao_fim"], fins % DIAS_POR_ESTACAO + 1)
+    colheitas = calcular_colheitas_vetorizado(dias_util, colunas["dias_cresc"], colunas["intervalo_colheita"], nomes)
+    lucro = np.where(colheitas > 0, colunas["preco_venda"] * multiplicadores_colheita(nomes) * colheitas, -np.inf)
+
+    if len(nomes):
+        melhor = np.argmax(lucro, axis=1)
+        melhor_lucro = lucro[np.arange(len(inicios)), melhor]
+    else:
+        melhor = np.zeros(len(inicios), dtype=np.int64)
+        melhor_lucro = np.full(len(inicios), -np.inf)
+    return inicios, fins, nomes[melhor] if len(nomes) else None, melhor_lucro
+
+
+def varrer_cenarios(cultivos_df, estrategias=ESTRATEGIAS_VARREDURA, quantidades=(1,)):
+    lucro_por_quadrado = np.full((TOTAL_DIAS_ANO, TOTAL_DIAS_ANO), np.nan)
+    melhor_cultivo = np.full((TOTAL_DIAS_ANO, TOTAL_DIAS_ANO), -1, dtype=np.int64)
+    plantas = []
+    indice_planta = {}
+
+    for idx_ini in range(len(ESTACOES)):
+        for idx_fim in range(idx_ini, len(ESTACOES)):
+            inicios, fins, nomes, lucro = _bloco_estacoes(idx_ini, idx_fim, cultivos_df)
+            possiveis = np.isfinite(lucro)
+            lucro_por_quadrado[inicios, fins] = np.where(possiveis, lucro, 0.0)
+            if nomes is None:
+                continue
+            for nome in np.unique(nomes[possiveis]).tolist():
+                if nome not in indice_planta:
+                    indice_planta[nome] = len(plantas)
+                    plantas.append(nome)
+            codigos = np.array([indice_planta.get(n, -1) for n in nomes.tolist()], dtype=np.int64)
+            melhor_cultivo[inicios, fins] = np.where(possiveis, codigos, -1)
+
+    quadrados = np.array([[converter_quantidade(e, q)[0] for q in quantidades] for e in estrategias], dtype=np.int64)
+    return {
+        "plantas": plantas,
+        "lucro_por_quadrado": lucro_por_quadrado,
+        "melhor_cultivo": melhor_cultivo,
+        "estrategias": list(estrategias),
+        "quantidades": list(quantidades),
+        "quadrados": quadrados,
+        "lucro_total": quadrados[:, :, None, None] * lucro_por_quadrado[None, None],
+    }
+
+
+def melhor_inicio(varredura):
+    lucro = np.nan_to_num(varredura["lucro_por_quadrado"], nan=-np.inf)
+    inicio, fim = np.unravel_index(np.argmax(lucro), lucro.shape)
+    return int(inicio), int(fim)
+
+
+def exportar_csv(varredura, caminho, separador=";"):
+    inicios, fins = np.nonzero(~np.isnan(varredura["lucro_por_quadrado"]))
+    with open(caminho, "w", encoding="utf-8", newline="") as f:
+        escritor = csv.writer(f, delimiter=separador)
+        escritor.writerow(["data_inicio", "dias_totais", "opcao_estrategia", "quantidade", "quadrados",
+                           "melhor_cultivo", "lucro_por_quadrado", "lucro_total"])
+        for i, f_ in zip(inicios.tolist(), fins.tolist()):
+            codigo = varredura["melhor_cultivo"][i, f_]
+            planta = varredura["plantas"][codigo] if codigo >= 0 else ""
+            periodo = f"{rotulo_dia(i)} -> {rotulo_dia(f_)}"
+            lucro = varredura["lucro_por_quadrado"][i, f_]
+            for e, estrategia in enumerate(varredura["estrategias"]):
+                for q, quantidade in enumerate(varredura["quantidades"]):
+                    escritor.writerow([periodo, f_ - i + 1, estrategia, quantidade, varredura["quadrados"][e, q],
+                                       planta, f"{lucro:.0f}", f"{varredura['lucro_total'][e, q, i, f_]:.0f}"])
+    return caminho
+
+
+def _rgb(cor_hex):
+    cor_hex = cor_hex.lstrip("#")
+    return np.array([int(cor_hex[i:i + 2], 16) for i in (0, 2, 4)], dtype=np.float64)
+
+
+def exportar_mapa_calor(varredura, caminho, modo="lucro", escala=4):
+    # Linhas = dia de início, colunas = dia de fim; as linhas escuras marcam a troca de estação.
+    from PIL import Image, ImageDraw
+
+    lucro = varredura["lucro_por_quadrado"]
+    invalidos = np.isnan(lucro)
+    pixels = np.empty(lucro.shape + (3,), dtype=np.float64)
+    if modo == "cultivo":
+        paleta = np.array([colorsys.hsv_to_rgb(i / max(1, len(varredura["plantas"])), 0.55, 0.9)
+                           for i in range(len(varredura["plantas"]))] + [(1.0, 1.0, 1.0)]) * 255
+        pixels[:] = paleta[varredura["melhor_cultivo"]]
+    else:
+        maximo = np.nanmax(lucro) if not invalidos.all() else 0
+        fracao = np.nan_to_num(lucro / maximo if maximo > 0 else lucro * 0)[..., None]
+        pixels[:] = _rgb(COR_CAL_DIA_BG) * (1 - fracao) + _rgb(COR_CAL_INTERVALO_INICIO_FIM) * fracao
+    pixels[invalidos] = _rgb(COR_CELULA_INVALIDA)
+
+    imagem = Image.fromarray(pixels.round().astype(np.uint8), "RGB")
+    imagem = imagem.resize((imagem.width * escala, imagem.height * escala), Image.Resampling.NEAREST)
+    draw = ImageDraw.Draw(imagem)
+    for borda in range(DIAS_POR_ESTACAO, TOTAL_DIAS_ANO, DIAS_POR_ESTACAO):
+        draw.line([(borda * escala, 0), (borda * escala, imagem.height)], fill=COR_CAL_BORDA_POPUP)
+        draw.line([(0, borda * escala), (imagem.width, borda * escala)], fill=COR_CAL_BORDA_POPUP)
+    imagem.save(caminho)
+    return caminho
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.varredura",
+                                     description="Avalia todos os intervalos do ano e exporta o melhor cultivo de cada um.")
+    parser.add_argument("--estrategias", nargs="+", choices=ESTRATEGIAS_VARREDURA, default=ESTRATEGIAS_VARREDURA)
+    parser.add_argument("--quantidades", nargs="+", type=int, default=[1], help="Quantidades a avaliar (padrão: 1).")
+    parser.add_argument("--csv", help="Arquivo CSV com uma linha por intervalo, estratégia e quantidade.")
+    parser.add_argument("--png", help="Mapa de calor do lucro por quadrado (início x fim).")
+    parser.add_argument("--png-cultivos", help="Mapa do melhor cultivo de cada intervalo.")
+    parser.add_argument("--cultivos", default=CAMINHO_CULTIVOS_CSV, help="Caminho do Cultivos.csv.")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    varredura = varrer_cenarios(carregar_cultivos(args.cultivos), args.estrategias, args.quantidades)
+    duracao = time.perf_counter() - inicio
+
+    i, f = melhor_inicio(varredura)
+    planta = varredura["plantas"][varredura["melhor_cultivo"][i, f]]
+    print(f"✅ {int((~np.isnan(varredura['lucro_por_quadrado'])).sum())} intervalos avaliados em {duracao * 1000:.0f} ms. "
+          f"Melhor: {rotulo_dia(i)} -> {rotulo_dia(f)} com {planta} ({varredura['lucro_por_quadrado'][i, f]:.0f} G por quadrado).")
+    if args.csv:
+        exportar_csv(varredura, args.csv)
+    if args.png:
+        exportar_mapa_calor(varredura, args.png)
+    if args.png_cultivos:
+        exportar_mapa_calor(varredura, args.png_cultivos, modo="cultivo")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,24 @@
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from config import CAMINHO_CULTIVOS_CSV, CAMINHO_EVENTOS_CSV
+from logica import carregar_cultivos, carregar_eventos, get_preco_semente_map
+from tratamento_dados import gerar_plano
+
+
+def test_intervalo_de_inverno_sem_cultivos_mantem_o_ouro():
+    df_cultivos = carregar_cultivos(CAMINHO_CULTIVOS_CSV, usar_snapshot=False)
+    df_eventos = carregar_eventos(CAMINHO_EVENTOS_CSV, usar_snapshot=False)
+    entrada = {"opcao_estrategia": "Área Plantável", "quantidade": 10,
+               "data_inicio": "Inverno D1 -> Inverno D28", "ouro_inicial": 500}
+
+    plano = gerar_plano(entrada, df_cultivos, df_eventos, get_preco_semente_map(df_cultivos), cache=None)
+
+    assert plano.simulacao["compras"] == []
+    assert plano.simulacao["ouro_final"] == 500
+    assert plano.simulacao["lucro"] == 0
+    assert len(plano.simulacao["saldo_diario"]) == 28